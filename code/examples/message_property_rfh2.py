@@ -0,0 +1,51 @@
+# See discussion and more examples at http://packages.python.org/pymqi/examples.html
+# or in doc/sphinx/examples.rst in the source distribution.
+
+# Fast small-message property path: instead of MQCRTMH/MQSETMP/MQINQMP
+# round-trips per message, the property is carried inline in the message body
+# as an RFH2 <usr> folder.  For tiny messages with one or two properties this
+# removes all the message-handle MQI calls on both the put and the get side.
+
+import logging
+
+import pymqi
+
+logging.basicConfig(level=logging.INFO)
+
+queue_manager = "QM01"
+channel = "SVRCONN.1"
+host = "192.168.1.135"
+port = "1434"
+queue_name = "TEST.1"
+message = b"Hello from Python!"
+conn_info = "%s(%s)" % (host, port)
+
+qmgr = pymqi.connect(queue_manager, channel, conn_info)
+
+put_md = pymqi.MD()
+put_md["Format"] = pymqi.CMQC.MQFMT_RF_HEADER_2
+put_md["CodedCharSetId"] = 1208
+
+put_rfh2 = pymqi.RFH2()
+put_rfh2["Format"] = pymqi.CMQC.MQFMT_STRING
+put_rfh2["NameValueCCSID"] = 1208
+put_rfh2.add_folder(b"<usr><Propertie_1>Hello from Python!</Propertie_1></usr>")
+
+put_queue = pymqi.Queue(qmgr, queue_name)
+put_queue.put_rfh2(message, put_md, pymqi.PMO(), [put_rfh2])
+
+# No MessageHandle and no MQGMO_PROPERTIES_IN_HANDLE on the way back either -
+# get_rfh2 parses the headers out of the message body.
+get_md = pymqi.MD()
+gmo = pymqi.GMO()
+rfh2_list = []
+get_queue = pymqi.Queue(qmgr, queue_name)
+message_body = get_queue.get_rfh2(None, get_md, gmo, rfh2_list)
+
+for rfh2 in rfh2_list:
+    if "usr" in rfh2.get():
+        logging.info("Message received. Propertie folder: `%s`" % rfh2["usr"])
+
+put_queue.close()
+get_queue.close()
+qmgr.disconnect()
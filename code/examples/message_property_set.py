@@ -1,48 +1,358 @@
 # See discussion and more examples at http://packages.python.org/pymqi/examples.html
 # or in doc/sphinx/examples.rst in the source distribution.
 
+import atexit
+import collections
 import logging
+import socket
+import threading
+import time
+
+try:
+    import queue as py_queue
+except ImportError:
+    import Queue as py_queue  # Python 2
 
 import pymqi
 
 logging.basicConfig(level=logging.INFO)
 
+# Module-level logger - avoids a logging.getLogger lookup per message on
+# the hot get loop.
+log = logging.getLogger(__name__)
+
 queue_manager = "QM01"
 channel = "SVRCONN.1"
 host = "192.168.1.135"
 port = "1434"
 queue_name = "TEST.1"
-message = "Hello from Python!"
-property_name = "Propertie_1"
 conn_info = "%s(%s)" % (host, port)
 
-qmgr = pymqi.connect(queue_manager, channel, conn_info)
+# Pre-encoded once at module scope - pymqe passes bytes straight through to
+# the MQI, so nothing is re-encoded per message on the put path.
+MESSAGE_BYTES = b"Hello from Python!"
+PROP_NAME_BYTES = b"Propertie_1"
+
+# Number of messages to put/get per unit of work.  Batching the puts and gets
+# under a single syncpoint amortises the MQ round-trips and log forces across
+# the whole batch - 64 is a good sweet spot, tune per workload.
+BATCH = 64
+
+# Byte budget per unit of work on the put side.  When message sizes vary a
+# count-only batch can force huge log writes, so the producer commits as
+# soon as either BATCH messages or BATCH_BYTES of payload are pending,
+# keeping each commit a disk-friendly extent.
+BATCH_BYTES = 256 * 1024
+
+# Open queues once for both input and output - one MQOPEN/MQCLOSE pair
+# instead of two, and the handle stays warm across batches.  MQOO_BROWSE is
+# included so the consumer can walk the queue with a browse cursor.
+QUEUE_OPEN_OPTIONS = (pymqi.CMQC.MQOO_INPUT_AS_Q_DEF |
+                      pymqi.CMQC.MQOO_OUTPUT |
+                      pymqi.CMQC.MQOO_BROWSE)
+
+# Connections are cached per (queue manager, channel, conn_info) and per
+# thread so that repeated invocations share one SVRCONN channel instead of
+# paying the TCP + MQCONN handshake every time.  MQ connection handles are
+# not safe to share across threads without care, hence the per-thread key.
+_QMGR_CACHE = {}
+
+def get_qmgr(queue_manager, channel, conn_info):
+    """Return a cached QueueManager connection, connecting on first use.
+
+    When the listener host is this machine, connect in bindings mode -
+    MQCONN over MQ's local shared-memory transport - instead of forcing a
+    TCP client channel, which removes the network framing and channel exit
+    cost from every MQI call."""
+    key = (queue_manager, channel, conn_info, threading.current_thread().name)
+    qmgr = _QMGR_CACHE.get(key)
+    if qmgr is None:
+        # conn_info is "host(port)" - the bindings-vs-client decision must
+        # come from the argument, not the module-global host, or a caller
+        # passing a different conn_info silently gets the wrong transport.
+        conn_host = conn_info.split("(", 1)[0]
+        if conn_host in ("localhost", "127.0.0.1", socket.gethostname()):
+            qmgr = pymqi.connect(queue_manager)
+        else:
+            # Client mode with MQCNO_RECONNECT: a transient network drop is
+            # healed by the MQ client re-establishing the SVRCONN channel
+            # transparently, instead of the script paying a full
+            # reconnect-and-reopen cycle.
+            cd = pymqi.CD()
+            cd.ChannelName = pymqi.py3str2bytes(channel)
+            cd.ConnectionName = pymqi.py3str2bytes(conn_info)
+            cd.ChannelType = pymqi.CMQC.MQCHT_CLNTCONN
+            cd.TransportType = pymqi.CMQC.MQXPT_TCP
+            qmgr = pymqi.QueueManager(None)
+            qmgr.connect_with_options(queue_manager,
+                                      opts=pymqi.CMQC.MQCNO_RECONNECT, cd=cd)
+        _QMGR_CACHE[key] = qmgr
+    return qmgr
+
+def close_thread_qmgrs():
+    """Disconnect the cached connections the calling thread created.
+
+    Under the default connect options MQ handles are thread-affine, so a
+    disconnect only succeeds on the thread that connected - a blanket
+    cache sweep from the main thread at exit would just collect
+    MQRC_HCONN_ERROR for every worker connection.  Each worker thread
+    calls this as it finishes; the atexit hook below only covers
+    connections made on the main thread itself."""
+    name = threading.current_thread().name
+    for key in [k for k in _QMGR_CACHE if k[3] == name]:
+        qmgr = _QMGR_CACHE.pop(key)
+        try:
+            qmgr.disconnect()
+        except pymqi.Error:
+            pass
+
+atexit.register(close_thread_qmgrs)
+
+# Message handles are pooled too - MQCRTMH is a round-trip of its own, so
+# reusing handles cuts the per-message MQI calls from 2*N to 2.  Setting a
+# property again on a reused handle simply replaces the previous value.
+_MH_POOL = collections.deque()
+
+def get_mh(qmgr):
+    """Pop a MessageHandle from the pool, or create one if the pool is empty."""
+    try:
+        return _MH_POOL.pop()
+    except IndexError:
+        return pymqi.MessageHandle(qmgr)
+
+def release_mh(mh):
+    """Return a MessageHandle to the pool for reuse."""
+    _MH_POOL.append(mh)
+
+# Prebuilt descriptor templates - constructing a PMO/GMO/MD walks every
+# field default in MQOpts, so build them once at module scope and only
+# mutate the message handle fields per use.  The PMO is only touched by the
+# producer thread and the GMO only by the consumer thread.
+_PMO_TEMPLATE = pymqi.PMO(Version=pymqi.CMQC.MQPMO_VERSION_3) #PMO v3 is minimal for using propeties
+# MQPMO_ASYNC_RESPONSE makes the client fire puts without waiting for a
+# per-message acknowledgement from the queue manager, overlapping network
+# latency with the next put.  Any asynchronous put failure is reported on
+# the MQCMIT at the end of the batch (this pymqe build does not expose
+# MQSTAT for mid-batch status checks).
+_PMO_TEMPLATE.Options = (_PMO_TEMPLATE.Options |
+                         pymqi.CMQC.MQPMO_SYNCPOINT |
+                         pymqi.CMQC.MQPMO_ASYNC_RESPONSE)
+
+# The consumer walks the queue with a browse cursor and then destructively
+# gets the message under the cursor - O(1) per message rather than a fresh
+# queue scan for each get.  The browse polls with MQGMO_NO_WAIT and an
+# adaptive backoff instead of blocking a native thread inside MQGET, so a
+# single Python thread could multiplex several queues this way.  The
+# destructive get under the cursor cannot miss.
+_BROWSE_GMO_TEMPLATE = pymqi.GMO(Version=pymqi.CMQC.MQGMO_CURRENT_VERSION)
+_BROWSE_GMO_TEMPLATE.Options = (pymqi.CMQC.MQGMO_BROWSE_NEXT |
+                                pymqi.CMQC.MQGMO_NO_WAIT |
+                                pymqi.CMQC.MQGMO_ACCEPT_TRUNCATED_MSG)
+
+# Backoff bounds for the empty-queue poll, in seconds.
+BACKOFF_INITIAL = 0.001
+BACKOFF_MAX = 0.05
+
+# Passing an explicit buffer size to get() makes pymqe allocate once per
+# call.  With the default (None) pymqi starts from a 4KB buffer and redoes
+# the whole MQGET if the message turns out bigger - two round-trips and two
+# allocations for every oversized message.  Size this to the expected
+# maximum message for the workload.
+GET_BUFFER_SIZE = 65536
+
+_GMO_TEMPLATE = pymqi.GMO(Version=pymqi.CMQC.MQGMO_CURRENT_VERSION)
+_GMO_TEMPLATE.Options = (pymqi.CMQC.MQGMO_PROPERTIES_IN_HANDLE |
+                         pymqi.CMQC.MQGMO_SYNCPOINT |
+                         pymqi.CMQC.MQGMO_MSG_UNDER_CURSOR)
+# Keep MQGMO_CONVERT off explicitly - the queue manager then never spends
+# cycles on CCSID/encoding conversion for these gets.  Payloads arrive as
+# published; decode client-side (and only when text is actually needed).
+_GMO_TEMPLATE.Options = _GMO_TEMPLATE.Options & ~pymqi.CMQC.MQGMO_CONVERT
+
+def drain(queue, qmgr, on_msg, batch=BATCH, wait_ms=100):
+    """Consume up to 'batch' messages from 'queue' under one syncpoint,
+    commit once, then fan the bodies out to the 'on_msg' callback.
+
+    This is the consumer-side atom most loops replicate poorly: one
+    MQGMO_WAIT get per message with an individual implicit commit.  Here
+    the whole batch is acknowledged with a single MQCMIT.  Returns the
+    number of messages consumed; the callback only runs after the commit,
+    so a callback failure never loses an uncommitted message."""
+    gmo = pymqi.GMO(Version=pymqi.CMQC.MQGMO_CURRENT_VERSION)
+    gmo.Options = (pymqi.CMQC.MQGMO_WAIT |
+                   pymqi.CMQC.MQGMO_SYNCPOINT |
+                   pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING)
+    gmo.WaitInterval = wait_ms
+
+    md = pymqi.MD()
+    msgs = []
+    while len(msgs) < batch:
+        try:
+            msgs.append(queue.get(GET_BUFFER_SIZE, md, gmo))
+        except pymqi.MQMIError as e:
+            if e.reason == pymqi.CMQC.MQRC_NO_MSG_AVAILABLE:
+                break
+            else:
+                raise
+        md.MsgId = pymqi.CMQC.MQMI_NONE
+        md.CorrelId = pymqi.CMQC.MQCI_NONE
+        md.GroupId = pymqi.CMQC.MQGI_NONE
+
+    qmgr.commit()
+    for msg in msgs:
+        on_msg(msg)
+    return len(msgs)
+
+# Hand-off buffers between the main thread and the MQ I/O threads.  The main
+# thread only enqueues payloads on send_q and reads results off recv_q - the
+# network round-trips happen on the worker threads.
+send_q = py_queue.Queue(maxsize=1024)
+recv_q = py_queue.Queue()
+
+class Producer(threading.Thread):
+    """ Owns its own queue manager connection and drains send_q onto the MQ
+    queue, committing every BATCH messages.  A None payload stops the thread.
+    """
+    def __init__(self):
+        threading.Thread.__init__(self)
+        self.daemon = True
+
+    def run(self):
+        qmgr = get_qmgr(queue_manager, channel, conn_info)
+
+        put_msg_h = get_mh(qmgr)
+        # set_many shares one packed MQPD/MQSMPO across all the MQSETMP
+        # calls - cheaper than calling set() once per property.
+        put_msg_h.properties.set_many({PROP_NAME_BYTES: MESSAGE_BYTES}) #default type is CMQC.MQTYPE_STRING
+
+        pmo = _PMO_TEMPLATE
+        pmo.OriginalMsgHandle = put_msg_h.msg_handle
+
+        put_md = pymqi.MD(Version=pymqi.CMQC.MQMD_CURRENT_VERSION)
+
+        # The 'with' block closes the queue even if a put raises, and the
+        # finally returns the message handle to the pool - an exception
+        # mid-batch no longer leaks an open handle.
+        try:
+            with pymqi.Queue(qmgr, queue_name, QUEUE_OPEN_OPTIONS) as put_queue:
+                pending_count = 0
+                pending_bytes = 0
+                while True:
+                    body = send_q.get()
+                    if body is None:
+                        break
+
+                    put_queue.put(body, put_md, pmo)
+                    pending_count = pending_count + 1
+                    pending_bytes = pending_bytes + len(body)
+                    # Commit on whichever budget fills first - message count
+                    # or bytes pending in the unit of work.
+                    if pending_count >= BATCH or pending_bytes >= BATCH_BYTES:
+                        qmgr.commit()
+                        pending_count = 0
+                        pending_bytes = 0
+
+                qmgr.commit()
+        finally:
+            release_mh(put_msg_h)
+            close_thread_qmgrs()
+
+class Consumer(threading.Thread):
+    """ Owns its own queue manager connection, gets messages (and their
+    properties) off the MQ queue and pushes the results onto recv_q.
+    """
+    def __init__(self, expected):
+        threading.Thread.__init__(self)
+        self.daemon = True
+        self.expected = expected
+
+    def run(self):
+        qmgr = get_qmgr(queue_manager, channel, conn_info)
+
+        get_msg_h = get_mh(qmgr)
+
+        gmo = _GMO_TEMPLATE
+        gmo.MsgHandle = get_msg_h.msg_handle
+
+        browse_md = pymqi.MD()
+        get_md = pymqi.MD()
+
+        try:
+            with pymqi.Queue(qmgr, queue_name, QUEUE_OPEN_OPTIONS) as get_queue:
+                self.consume(qmgr, get_queue, get_msg_h, gmo, browse_md, get_md)
+        finally:
+            release_mh(get_msg_h)
+            close_thread_qmgrs()
+
+    def consume(self, qmgr, get_queue, get_msg_h, gmo, browse_md, get_md):
+        count = 0
+        backoff = BACKOFF_INITIAL
+        while count < self.expected:
+            # Advance the browse cursor to the next message, then get the
+            # message under the cursor destructively.  The browse asks for
+            # a zero-length buffer and accepts truncation - it only needs
+            # to position the cursor, not transfer the body.  On an empty
+            # queue, sleep and double the backoff up to BACKOFF_MAX; reset
+            # it as soon as a message arrives.
+            try:
+                get_queue.get(0, browse_md, _BROWSE_GMO_TEMPLATE)
+            except pymqi.MQMIError as e:
+                if e.reason == pymqi.CMQC.MQRC_NO_MSG_AVAILABLE:
+                    time.sleep(backoff)
+                    backoff = min(backoff * 2, BACKOFF_MAX)
+                    continue
+                elif e.reason != pymqi.CMQC.MQRC_TRUNCATED_MSG_ACCEPTED:
+                    raise
+            backoff = BACKOFF_INITIAL
+            browse_md.MsgId = pymqi.CMQC.MQMI_NONE
+            browse_md.CorrelId = pymqi.CMQC.MQCI_NONE
+            browse_md.GroupId = pymqi.CMQC.MQGI_NONE
+
+            message_body = get_queue.get(GET_BUFFER_SIZE, get_md, gmo)
+
+            property_value = get_msg_h.properties.get(PROP_NAME_BYTES)
+            # Level guard plus deferred %s args - no string formatting at
+            # all when INFO is filtered out.
+            if log.isEnabledFor(logging.INFO):
+                log.info("Message received. Propertie name: `%s`, propertie value: `%s`", PROP_NAME_BYTES, property_value)
+
+            # The raw bytes are passed through untouched - a consumer that
+            # needs text decodes with message_body.decode('utf-8', 'replace')
+            # at the point of use, never on behalf of pass-through routing.
+            recv_q.put((message_body, property_value))
 
-put_msg_h = pymqi.MessageHandle(qmgr)
-put_msg_h.properties.set(property_name, message) #default type is CMQC.MQTYPE_STRING
+            # Reset the MsgId, CorrelId & GroupId so that we can reuse
+            # the same 'md' object again.
+            get_md.MsgId = pymqi.CMQC.MQMI_NONE
+            get_md.CorrelId = pymqi.CMQC.MQCI_NONE
+            get_md.GroupId = pymqi.CMQC.MQGI_NONE
 
-pmo = pymqi.PMO(Version=pymqi.CMQC.MQPMO_VERSION_3) #PMO v3 is minimal for using propeties
-pmo.OriginalMsgHandle = put_msg_h.msg_handle
+            count = count + 1
+            if count % BATCH == 0:
+                qmgr.commit()
 
-put_md = pymqi.MD(Version=pymqi.CMQC.MQMD_CURRENT_VERSION)
+        qmgr.commit()
 
-put_queue = pymqi.Queue(qmgr, queue_name)
-put_queue.put(b'', put_md, pmo)
+def main():
+    producer = Producer()
+    consumer = Consumer(BATCH)
 
-#getting message with propertie
-get_msg_h = pymqi.MessageHandle(qmgr)
+    producer.start()
+    consumer.start()
 
-gmo = pymqi.GMO(Version=pymqi.CMQC.MQGMO_CURRENT_VERSION)
-gmo.Options = pymqi.CMQC.MQGMO_PROPERTIES_IN_HANDLE
-gmo.MsgHandle = get_msg_h.msg_handle
+    # The main thread only feeds work in and collects results.
+    for i in range(BATCH):
+        send_q.put(b'')
+    send_q.put(None)
 
-get_md = pymqi.MD()
-get_queue = pymqi.Queue(qmgr, queue_name)
-message_body = get_queue.get(None, get_md, gmo)
+    for i in range(BATCH):
+        recv_q.get()
 
-property_value = get_msg_h.properties.get(property_name)
-logging.info("Message received. Propertie name: `%s`, propertie value: `%s`" % (property_name, property_value))
+    producer.join()
+    consumer.join()
 
-put_queue.close()
-get_queue.close()
-qmgr.disconnect()
+# No MQ connection is made on plain import - tooling can scan this module
+# without triggering an MQCONN, and the helpers above (get_qmgr, get_mh,
+# the descriptor templates) are importable by other scripts.
+if __name__ == "__main__":
+    main()
@@ -112,16 +112,89 @@ from __future__ import print_function
 import pymqi
 import struct
 import binascii
+import codecs
+import collections
+import fnmatch
+import logging
 import re
 import argparse
+import array
 import sys
+import threading
+import time
+
+try:
+    import queue
+except ImportError:  # Python 2
+    import Queue as queue
+
+try:
+    _array_tobytes = array.array.tobytes
+    _array_frombytes = array.array.frombytes
+except AttributeError:  # Python 2
+    _array_tobytes = array.array.tostring
+    _array_frombytes = array.array.fromstring
+
+#  The pure single-byte EBCDIC codepages with stdlib codecs - 37 is the
+#  Z/OS default called out in the module docstring.  For these, codepage
+#  conversion can be done with a precomputed 256-byte translate table (one
+#  native pass over the buffer) instead of a codec call per string field.
+logger = logging.getLogger(__name__)
+
+_EBCDIC_CCSIDS = (37, 500)
+_ALL_BYTES = bytes(bytearray(range(256)))
+
+#  Bound encoder for the Z/OS default codepage, looked up once at import so
+#  callers encoding MQSC escape text per command skip the codec registry.
+_CP037_ENCODE = codecs.getencoder("cp037")
+
+#  Hot constants bound once at import.  The structure constructors and the
+#  add/set methods run once per parameter per message; going through
+#  pymqi.CMQCFC costs two attribute lookups per constant each time.
+_MQLONG_TYPE = pymqi.MQLONG_TYPE
+_MQLONG_SIZE = struct.calcsize(pymqi.MQLONG_TYPE)
+_MQCCSI_DEFAULT = pymqi.CMQC.MQCCSI_DEFAULT
+_MQCFT_INTEGER = pymqi.CMQCFC.MQCFT_INTEGER
+_MQCFIN_STRUC_LENGTH = pymqi.CMQCFC.MQCFIN_STRUC_LENGTH
+_MQCFT_INTEGER_LIST = pymqi.CMQCFC.MQCFT_INTEGER_LIST
+_MQCFIL_STRUC_LENGTH_FIXED = pymqi.CMQCFC.MQCFIL_STRUC_LENGTH_FIXED
+_MQCFT_STRING = pymqi.CMQCFC.MQCFT_STRING
+_MQCFST_STRUC_LENGTH_FIXED = pymqi.CMQCFC.MQCFST_STRUC_LENGTH_FIXED
+_MQCFT_STRING_LIST = pymqi.CMQCFC.MQCFT_STRING_LIST
+_MQCFSL_STRUC_LENGTH_FIXED = pymqi.CMQCFC.MQCFSL_STRUC_LENGTH_FIXED
+
+def _ebcdic_tables(ccsid):
+    """_ebcdic_tables(ccsid)
+
+    Return the (inbound, outbound) translate tables for a single-byte
+    EBCDIC ccsid, or (None, None) for any other codepage."""
+
+    if ccsid not in _EBCDIC_CCSIDS:
+        return (None, None)
+    codec = "cp%03d" % ccsid
+    to_latin1 = _ALL_BYTES.decode(codec).encode("latin-1")
+    from_latin1 = _ALL_BYTES.decode("latin-1").encode(codec)
+    return (to_latin1, from_latin1)
+
+def _as_bytes(buff):
+    """Materialize a buffer slice as bytes.
+
+    The unpack methods accept memoryviews so callers can hand out
+    zero-copy views of a large response buffer; only the variable tail
+    that is actually kept gets copied, here."""
+
+    if isinstance(buff, memoryview):
+        return buff.tobytes()
+    return buff
 
 class MQOptsWithEncoding(pymqi.MQOpts):
     """
     MQOpt class that can handle numeric encoding.  
     Encoding needs to be set for big-endian systems like Z/OS."""
     
-    big_endian_encodings = [#1
+    # frozenset: the containment test runs once per PCF field per message,
+    # so an O(1) hashed lookup beats scanning a 9 element list.
+    big_endian_encodings = frozenset([#1
                             pymqi.CMQC.MQENC_INTEGER_NORMAL,
                             #16
                             pymqi.CMQC.MQENC_DECIMAL_NORMAL,
@@ -145,33 +218,105 @@ class MQOptsWithEncoding(pymqi.MQOpts):
                             #785
                             pymqi.CMQC.MQENC_INTEGER_NORMAL +
                             pymqi.CMQC.MQENC_DECIMAL_NORMAL +
-                            pymqi.CMQC.MQENC_FLOAT_S390]
+                            pymqi.CMQC.MQENC_FLOAT_S390])
     
+    # Subclasses with a fixed all-MQLONG layout define the field name tuple
+    # plus two precompiled Structs (native and big-endian).  pack/unpack can
+    # then go straight through struct without reparsing the format string or
+    # re-running MQOpts.__init__ for an endian change.
+    _FIELDS = None
+    _STRUCT_NE = None
+    _STRUCT_BE = None
+
+    def _fixed_struct(self, encoding):
+        if encoding in self.big_endian_encodings:
+            return self._STRUCT_BE
+        return self._STRUCT_NE
+
+    def unpack_fixed(self, buff, encoding=None):
+        """unpack_fixed(buff, encoding)
+
+        Unpack the fixed part of the structure with the precompiled Struct
+        for the given encoding, without rebuilding the MQOpts."""
+
+        values = self._fixed_struct(encoding).unpack_from(buff)
+        for name, value in zip(self._FIELDS, values):
+            setattr(self, name, value)
+
+    def _set_tail(self, name, value):
+        """_set_tail(name, value)
+
+        Install or update the trailing variable length field and
+        re-initialise MQOpts once.  The current field values are embedded
+        into the opts list before the rebuild, so the get()/set() round-trip
+        (a dict build plus a setattr per field) is not needed and the
+        MQOpts.__init__ cost is paid once per mutation instead of twice."""
+
+        opts = list(self._MQOpts__list)
+        if len(opts) > 0 and opts[-1][0] == name:
+            opts.pop()
+        for entry in opts:
+            entry[1] = getattr(self, entry[0])
+        opts.append([name, value, "%is" % len(value)])
+        self.opts = tuple(opts)
+        pymqi.MQOpts.__init__(self, self.opts)
+
     def pack(self, encoding=None):
         """pack(encoding)
 
         Override pack in order to set correct numeric encoding in the format."""
-        if encoding is not None:
-            if encoding in self.big_endian_encodings:
-                self._MQOpts__list[0][2] = ">" + self._MQOpts__list[0][2]
-                saved_values = self.get()
-                #apply the new opts
-                pymqi.MQOpts.__init__(*(self, tuple(self._MQOpts__list)))
-                #set from saved values
-                self.set(**saved_values)
-        
+        if self._FIELDS is not None and len(self._MQOpts__list) == len(self._FIELDS):
+            fixed_struct = self._fixed_struct(encoding)
+            return fixed_struct.pack(*[getattr(self, name) for name in self._FIELDS])
+
+        if encoding in self.big_endian_encodings:
+            # The endianness is applied at pack time instead of mutating the
+            # field formats: repeated calls used to prepend ">" again and
+            # again, corrupting the format, and each toggle forced a full
+            # MQOpts rebuild.
+            values = [getattr(self, entry[0]) for entry in self._MQOpts__list]
+            return struct.pack(">" + self._MQOpts__format, *values)
+
         return pymqi.MQOpts.pack(self)
-    
+
+    def finalize(self):
+        """finalize()
+
+        Hook for subclasses that defer work from their add_* methods."""
+
+    def pack_into(self, buf, offset, encoding=None):
+        """pack_into(buf, offset, encoding)
+
+        Pack the structure into a preallocated buffer at the given offset
+        and return the offset past it.  Skips the intermediate bytes
+        object that pack() allocates per structure."""
+
+        fixed_struct = self._fixed_struct(encoding)
+        fixed_struct.pack_into(buf, offset, *[getattr(self, name) for name in self._FIELDS])
+        offset += fixed_struct.size
+        for entry in self._MQOpts__list[len(self._FIELDS):]:
+            value = getattr(self, entry[0])
+            next_offset = offset + len(value)
+            buf[offset:next_offset] = value
+            offset = next_offset
+        return offset
+
     def unpack(self, buff, encoding=None):
         """unpack(buff, encoding)
-        
+
         Unpack a buffer taking the encoding into account."""
-        
+
+        if self._FIELDS is not None and len(self._MQOpts__list) == len(self._FIELDS):
+            self.unpack_fixed(buff, encoding)
+            return
+
+        unpack_format = self._MQOpts__format
         if encoding in self.big_endian_encodings:
-            self._MQOpts__list[0][2] = ">" + self._MQOpts__list[0][2]
-            
-        pymqi.MQOpts.__init__(*(self, tuple(self._MQOpts__list)))
-        pymqi.MQOpts.unpack(self, buff)
+            unpack_format = ">" + unpack_format
+
+        values = struct.unpack_from(unpack_format, buff)
+        for entry, value in zip(self._MQOpts__list, values):
+            setattr(self, entry[0], value)
   
         
 class CFH(MQOptsWithEncoding):
@@ -181,8 +326,13 @@ class CFH(MQOptsWithEncoding):
     default values may be overridden by the optional keyword arguments
     'kw'."""
 
+    _FIELDS = ('Type', 'StrucLength', 'Version', 'Command', 'MsgSeqNumber',
+               'Control', 'CompCode', 'Reason', 'ParameterCount')
+    _STRUCT_NE = struct.Struct("9" + pymqi.MQLONG_TYPE)
+    _STRUCT_BE = struct.Struct(">9" + pymqi.MQLONG_TYPE)
+
     def __init__(self, **kw):
-        pymqi.MQOpts.__init__(*(self, (
+        pymqi.MQOpts.__init__(self, (
             ['Type', pymqi.CMQCFC.MQCFT_COMMAND, pymqi.MQLONG_TYPE],
             ['StrucLength', pymqi.CMQCFC.MQCFH_STRUC_LENGTH, pymqi.MQLONG_TYPE],
             ['Version', pymqi.CMQCFC.MQCFH_CURRENT_VERSION, pymqi.MQLONG_TYPE],
@@ -192,10 +342,47 @@ class CFH(MQOptsWithEncoding):
             ['CompCode', pymqi.CMQC.MQCC_OK, pymqi.MQLONG_TYPE],
             ['Reason', pymqi.CMQC.MQRC_NONE, pymqi.MQLONG_TYPE],
             ['ParameterCount', 0, pymqi.MQLONG_TYPE],
-            )), **kw)
+            ), **kw)
 
 cfh = CFH
 
+#  Default CFH bytes packed once per endianness, plus single-MQLONG Structs
+#  to patch the varying fields in place.  pack_bag copies a template and
+#  patches it rather than building and packing a CFH per command.
+# Exact-type dispatch in pack_bag: type(x) is / in on these is a pointer
+# comparison, where isinstance() has to walk the MRO per check.
+_STR_TYPES = (str, bytes)
+
+# Whitespace-run collapse used on z/OS MQSC response messages.
+_WS_RE = re.compile(r"\s+")
+
+_CFH_TEMPLATE_NE = CFH().pack()
+_CFH_TEMPLATE_BE = CFH().pack(encoding=pymqi.CMQC.MQENC_INTEGER_NORMAL)
+_LONG_NE = struct.Struct(pymqi.MQLONG_TYPE)
+_LONG_BE = struct.Struct(">" + pymqi.MQLONG_TYPE)
+
+# The (Type, StrucLength) pair read once per parameter in unpack_bag.
+_LONG_PAIR_NE = struct.Struct(pymqi.MQLONG_TYPE * 2)
+_LONG_PAIR_BE = struct.Struct(">" + pymqi.MQLONG_TYPE * 2)
+
+
+def _scan_pcf(mem_buff, offset, buff_len, long_pair):
+    """_scan_pcf(mem_buff, offset, buff_len, long_pair)
+
+    First pass over a PCF response: read each (Type, StrucLength) header
+    pair and return a list of (offset, parm_type, struc_len) entries.
+    Separating the scan from structure construction keeps this loop down
+    to one bound unpack_from call per parameter."""
+
+    index = []
+    append = index.append
+    unpack_from = long_pair.unpack_from
+    while offset < buff_len:
+        parm_type, struc_len = unpack_from(mem_buff, offset)
+        append((offset, parm_type, struc_len))
+        offset += struc_len
+    return index
+
 class CFBS(MQOptsWithEncoding):
     """CFBS(**kw)
 
@@ -203,40 +390,34 @@ class CFBS(MQOptsWithEncoding):
     default values may be overridden by the optional keyword arguments
     'kw'."""
 
+    _FIELDS = ('Type', 'StrucLength', 'Parameter', 'StringLength')
+    _STRUCT_NE = struct.Struct("4" + pymqi.MQLONG_TYPE)
+    _STRUCT_BE = struct.Struct(">4" + pymqi.MQLONG_TYPE)
+
     def __init__(self, **kw):
-        pymqi.MQOpts.__init__(*(self, (
+        pymqi.MQOpts.__init__(self, (
             ['Type', pymqi.CMQCFC.MQCFT_BYTE_STRING, pymqi.MQLONG_TYPE],
             ['StrucLength', pymqi.CMQCFC.MQCFBS_STRUC_LENGTH_FIXED, pymqi.MQLONG_TYPE],
             ['Parameter', 0, pymqi.MQLONG_TYPE],
             ['StringLength', 0, pymqi.MQLONG_TYPE]
             #['String', pymqi.CMQCFC.MQCFC_LAST,'1s']
-            )), **kw)
+            ), **kw)
         
     def unpack(self, buff, encoding=None):
         """unpack(buff, encoding)
         
         Unpack a buffer into a CFBS struct taking the encoding into account."""
         
-        if encoding in self.big_endian_encodings:
-            self._MQOpts__list[0][2] = ">" + self._MQOpts__list[0][2]
-                
-        pymqi.MQOpts.__init__(*(self, tuple(self._MQOpts__list)))
-        pymqi.MQOpts.unpack(self, buff[:pymqi.CMQCFC.MQCFBS_STRUC_LENGTH_FIXED])
-        
-        string_value = buff[pymqi.CMQCFC.MQCFBS_STRUC_LENGTH_FIXED:]
+        self.unpack_fixed(buff, encoding)
+
         if self["StringLength"] == 0:
+            string_value = _as_bytes(buff[pymqi.CMQCFC.MQCFBS_STRUC_LENGTH_FIXED:])
             self["StringLength"] = len(string_value)
         else:
-            string_value = buff[pymqi.CMQCFC.MQCFBS_STRUC_LENGTH_FIXED:pymqi.CMQCFC.MQCFBS_STRUC_LENGTH_FIXED + self["StringLength"]]
-        
-        self.opts = self._MQOpts__list + (["String", string_value, "%is" % len(string_value)], )
+            string_value = _as_bytes(buff[pymqi.CMQCFC.MQCFBS_STRUC_LENGTH_FIXED:pymqi.CMQCFC.MQCFBS_STRUC_LENGTH_FIXED + self["StringLength"]])
+
         self["StrucLength"] = pymqi.CMQCFC.MQCFBS_STRUC_LENGTH_FIXED +  len(string_value)
-        #save the current values
-        saved_values = self.get()
-        #apply the new opts
-        pymqi.MQOpts.__init__(*(self, tuple(self.opts)))
-        #set from saved values
-        self.set(**saved_values)
+        self._set_tail("String", string_value)
 cfbs = CFBS        
         
 class CFBF(MQOptsWithEncoding):
@@ -246,15 +427,19 @@ class CFBF(MQOptsWithEncoding):
     default values may be overridden by the optional keyword arguments
     'kw'."""
 
+    _FIELDS = ('Type', 'StrucLength', 'Parameter', 'Operator', 'FilterValueLength')
+    _STRUCT_NE = struct.Struct("5" + pymqi.MQLONG_TYPE)
+    _STRUCT_BE = struct.Struct(">5" + pymqi.MQLONG_TYPE)
+
     def __init__(self, **kw):
-        pymqi.MQOpts.__init__(*(self, (
+        pymqi.MQOpts.__init__(self, (
             ['Type', pymqi.CMQCFC.MQCFT_BYTE_STRING_FILTER, pymqi.MQLONG_TYPE],
             ['StrucLength', pymqi.CMQCFC.MQCFBF_STRUC_LENGTH_FIXED, pymqi.MQLONG_TYPE],
             ['Parameter', 0, pymqi.MQLONG_TYPE],
             ['Operator', 0, pymqi.MQLONG_TYPE],
             ['FilterValueLength', 0, pymqi.MQLONG_TYPE]
             #['FilterValue', '','1s']
-            )), **kw)        
+            ), **kw)        
 cfbf = CFBF
 
 class CFGR(MQOptsWithEncoding):
@@ -264,13 +449,17 @@ class CFGR(MQOptsWithEncoding):
     default values may be overridden by the optional keyword arguments
     'kw'."""
 
+    _FIELDS = ('Type', 'StrucLength', 'Parameter', 'ParameterCount')
+    _STRUCT_NE = struct.Struct("4" + pymqi.MQLONG_TYPE)
+    _STRUCT_BE = struct.Struct(">4" + pymqi.MQLONG_TYPE)
+
     def __init__(self, **kw):
-        pymqi.MQOpts.__init__(*(self, (
+        pymqi.MQOpts.__init__(self, (
             ['Type', pymqi.CMQCFC.MQCFT_GROUP, pymqi.MQLONG_TYPE],
             ['StrucLength', pymqi.CMQCFC.MQCFGR_STRUC_LENGTH, pymqi.MQLONG_TYPE],
             ['Parameter', 0, pymqi.MQLONG_TYPE],
             ['ParameterCount', 0, pymqi.MQLONG_TYPE]
-            )), **kw)       
+            ), **kw)       
 
 cfgr = CFGR
         
@@ -281,14 +470,18 @@ class CFIF(MQOptsWithEncoding):
     default values may be overridden by the optional keyword arguments
     'kw'."""
 
+    _FIELDS = ('Type', 'StrucLength', 'Parameter', 'Operator', 'FilterValue')
+    _STRUCT_NE = struct.Struct("5" + pymqi.MQLONG_TYPE)
+    _STRUCT_BE = struct.Struct(">5" + pymqi.MQLONG_TYPE)
+
     def __init__(self, **kw):
-        pymqi.MQOpts.__init__(*(self, (
+        pymqi.MQOpts.__init__(self, (
             ['Type', pymqi.CMQCFC.MQCFT_INTEGER_FILTER, pymqi.MQLONG_TYPE],
             ['StrucLength', pymqi.CMQCFC.MQCFBF_STRUC_LENGTH_FIXED, pymqi.MQLONG_TYPE],
             ['Parameter', 0, pymqi.MQLONG_TYPE],
             ['Operator', 0, pymqi.MQLONG_TYPE],
             ['FilterValue', 0,pymqi.MQLONG_TYPE]
-            )), **kw)  
+            ), **kw)  
 
 cfif = CFIF       
         
@@ -299,13 +492,17 @@ class CFIN(MQOptsWithEncoding):
     default values may be overridden by the optional keyword arguments
     'kw'."""
 
+    _FIELDS = ('Type', 'StrucLength', 'Parameter', 'Value')
+    _STRUCT_NE = struct.Struct("4" + pymqi.MQLONG_TYPE)
+    _STRUCT_BE = struct.Struct(">4" + pymqi.MQLONG_TYPE)
+
     def __init__(self, **kw):
-        pymqi.MQOpts.__init__(*(self, (
-            ['Type', pymqi.CMQCFC.MQCFT_INTEGER, pymqi.MQLONG_TYPE],
-            ['StrucLength', pymqi.CMQCFC.MQCFIN_STRUC_LENGTH, pymqi.MQLONG_TYPE],
-            ['Parameter', 0, pymqi.MQLONG_TYPE],
-            ['Value', 0,pymqi.MQLONG_TYPE]
-            )), **kw)  
+        pymqi.MQOpts.__init__(self, (
+            ['Type', _MQCFT_INTEGER, _MQLONG_TYPE],
+            ['StrucLength', _MQCFIN_STRUC_LENGTH, _MQLONG_TYPE],
+            ['Parameter', 0, _MQLONG_TYPE],
+            ['Value', 0, _MQLONG_TYPE]
+            ), **kw)  
 
 cfin = CFIN
         
@@ -316,77 +513,117 @@ class CFIL(MQOptsWithEncoding):
     default values may be overridden by the optional keyword arguments
     'kw'."""
     
-    integer_list = []
+    _FIELDS = ('Type', 'StrucLength', 'Parameter', 'Count')
+    _STRUCT_NE = struct.Struct("4" + pymqi.MQLONG_TYPE)
+    _STRUCT_BE = struct.Struct(">4" + pymqi.MQLONG_TYPE)
+    _int_struct_ne = struct.Struct(pymqi.MQLONG_TYPE)
+
     def __init__(self, **kw):
         self.integer_list = []
-        pymqi.MQOpts.__init__(*(self, (
-            ['Type', pymqi.CMQCFC.MQCFT_INTEGER_LIST, pymqi.MQLONG_TYPE],
-            ['StrucLength', pymqi.CMQCFC.MQCFIL_STRUC_LENGTH_FIXED, pymqi.MQLONG_TYPE],
-            ['Parameter', 0, pymqi.MQLONG_TYPE],
-            ['Count', 0, pymqi.MQLONG_TYPE],
-            )), **kw) 
+        self._int_buf = bytearray()
+        self._tail_stale = False
+        self._swap_needed = False
+        pymqi.MQOpts.__init__(self, (
+            ['Type', _MQCFT_INTEGER_LIST, _MQLONG_TYPE],
+            ['StrucLength', _MQCFIL_STRUC_LENGTH_FIXED, _MQLONG_TYPE],
+            ['Parameter', 0, _MQLONG_TYPE],
+            ['Count', 0, _MQLONG_TYPE],
+            ), **kw)
+
 
-    
     def add_integer(self, value, encoding=None):
         """add_integer(value)
-        
-        Add an integer to the list and update the structure accordingly."""
-        
+
+        Add an integer to the list and update the structure accordingly.
+
+        Only the new integer is packed (4 bytes appended to a growing
+        bytearray) - the opts rebuild is deferred to finalize()."""
+
         self.integer_list.append(value)
-        
-    
+
+
         self["Count"] = self["Count"] + 1
-        self["StrucLength"] =  pymqi.CMQCFC.MQCFIL_STRUC_LENGTH_FIXED + (struct.calcsize(pymqi.MQLONG_TYPE) *  self["Count"])
-        
-        string_value = ""
-        format_str = "i" * len(self.integer_list)
-        #for i in self.integer_list:
+        self["StrucLength"] =  _MQCFIL_STRUC_LENGTH_FIXED + (_MQLONG_SIZE *  self["Count"])
+
+        self._int_buf.extend(self._int_struct_ne.pack(value))
+        self._swap_needed = (encoding in self.big_endian_encodings
+                             and sys.byteorder == "little")
+        self._tail_stale = True
+
+    def add_integers(self, values, encoding=None):
+        """add_integers(values, encoding)
+
+        Add a whole list of integers in one call - a single C-level
+        struct.pack of all the values instead of one add_integer() call
+        (and one 4-byte append) per element."""
+
+        if len(values) == 0:
+            return
+        self.integer_list.extend(values)
+
+        self["Count"] = self["Count"] + len(values)
+        self["StrucLength"] =  _MQCFIL_STRUC_LENGTH_FIXED + (_MQLONG_SIZE *  self["Count"])
+
+        self._int_buf.extend(struct.pack("%i%s" % (len(values), pymqi.MQLONG_TYPE), *values))
+        self._swap_needed = (encoding in self.big_endian_encodings
+                             and sys.byteorder == "little")
+        self._tail_stale = True
+
+    def finalize(self):
+        """finalize()
+
+        Install the accumulated integer list as the trailing field.  Called
+        automatically by pack() so add_integer() stays O(1) per add.  A
+        big-endian target is handled with one array.byteswap() over the
+        whole list - a single native loop - rather than a per-int swap."""
+
+        if self._tail_stale:
+            if self._swap_needed:
+                int_array = array.array(pymqi.MQLONG_TYPE, self.integer_list)
+                int_array.byteswap()
+                self._set_tail("IntegerList", _array_tobytes(int_array))
+            else:
+                self._set_tail("IntegerList", bytes(self._int_buf))
+            self._tail_stale = False
+
+    def pack(self, encoding=None):
+        """pack(encoding)
+
+        Finalize any pending add_integer() calls before packing."""
+
+        self.finalize()
+        return MQOptsWithEncoding.pack(self, encoding)
+
+    def pack_into(self, buf, offset, encoding=None):
+        """pack_into(buf, offset, encoding)
+
+        Finalize any pending add_integer() calls before packing."""
+
+        self.finalize()
+        return MQOptsWithEncoding.pack_into(self, buf, offset, encoding)
 
-        if encoding in self.big_endian_encodings and not self._MQOpts__list[0][2].startswith(">"):
-            string_value = struct.pack(">" + format_str, *self.integer_list)
-        else:
-            string_value = struct.pack(format_str, *self.integer_list)
-        
-        if hasattr(self, "IntegerList"):
-            self["IntegerList"] = string_value
-            self.opts = self._MQOpts__list[:-1] + (["IntegerList", string_value, "%is" % len(string_value)], )
-        else:
-            self.opts = self._MQOpts__list + (["IntegerList", string_value, "%is" % len(string_value)], )
-             
-        saved_values = self.get()
-       
-        #apply the new opts
-        pymqi.MQOpts.__init__(*(self, tuple(self.opts)))
-        #set from saved values
-        self.set(**saved_values)               
-            
     def unpack(self, buff, encoding=None):
         """unpack(buff, encoding)
         
         Unpack a buffer into the CFIL structure."""
             
-        if encoding in self.big_endian_encodings:
-            self._MQOpts__list[0][2] = ">" + self._MQOpts__list[0][2]
-                
-        pymqi.MQOpts.__init__(*(self, tuple(self._MQOpts__list)))
-        pymqi.MQOpts.unpack(self, buff[:pymqi.CMQCFC.MQCFIL_STRUC_LENGTH_FIXED])
-        
-        string_value = buff[pymqi.CMQCFC.MQCFIL_STRUC_LENGTH_FIXED:]
-       
-        self.opts = self._MQOpts__list + (["IntegerList", string_value, "%is" % len(string_value)], )
-        if self["StrucLength"] == pymqi.CMQCFC.MQCFST_STRUC_LENGTH_FIXED or self["StrucLength"] == 0: 
-            self["StrucLength"] = pymqi.CMQCFC.MQCFST_STRUC_LENGTH_FIXED +  len(string_value)
-        
-        int_buf = string_value    
-        for _i in range(self["Count"]):
-            self.integer_list.append(struct.unpack(pymqi.MQLONG_TYPE, int_buf[:4]))
-            int_buf = int_buf[4:]
-        #save the current values
-        saved_values = self.get()
-        #apply the new opts
-        pymqi.MQOpts.__init__(*(self, tuple(self.opts)))
-        #set from saved values
-        self.set(**saved_values)                 
+        self.unpack_fixed(buff, encoding)
+
+        string_value = _as_bytes(buff[_MQCFIL_STRUC_LENGTH_FIXED:])
+
+        if self["StrucLength"] == _MQCFST_STRUC_LENGTH_FIXED or self["StrucLength"] == 0:
+            self["StrucLength"] = _MQCFST_STRUC_LENGTH_FIXED +  len(string_value)
+
+        count = self["Count"]
+        if count > 0:
+            int_array = array.array(pymqi.MQLONG_TYPE)
+            _array_frombytes(int_array, string_value[:count * int_array.itemsize])
+            if encoding in self.big_endian_encodings and sys.byteorder == "little":
+                int_array.byteswap()
+            self.integer_list.extend(int_array)
+        self._int_buf = bytearray(string_value)
+
+        self._set_tail("IntegerList", string_value)
 
 cfil = CFIL         
 
@@ -397,8 +634,13 @@ class CFSF(MQOptsWithEncoding):
     default values may be overridden by the optional keyword arguments
     'kw'."""
 
+    _FIELDS = ('Type', 'StrucLength', 'Parameter', 'Operator',
+               'CodedCharSetId', 'FilterValueLength')
+    _STRUCT_NE = struct.Struct("6" + pymqi.MQLONG_TYPE)
+    _STRUCT_BE = struct.Struct(">6" + pymqi.MQLONG_TYPE)
+
     def __init__(self, **kw):
-        pymqi.MQOpts.__init__(*(self, (
+        pymqi.MQOpts.__init__(self, (
             ['Type', pymqi.CMQCFC.MQCFT_STRING_FILTER, pymqi.MQLONG_TYPE],
             ['StrucLength', pymqi.CMQCFC.MQCFSF_STRUC_LENGTH_FIXED, pymqi.MQLONG_TYPE],
             ['Parameter', 0, pymqi.MQLONG_TYPE],
@@ -406,35 +648,26 @@ class CFSF(MQOptsWithEncoding):
             ['CodedCharSetId', pymqi.CMQC.MQCCSI_DEFAULT, pymqi.MQLONG_TYPE],
             ['FilterValueLength', 0, pymqi.MQLONG_TYPE]
             #['FilterValue', '','1s']
-            )), **kw)     
+            ), **kw)     
             
     def unpack(self, buff, encoding=None):
         """unpack(buff, encoding)
         
         Unpack a buffer into the CFSF structure."""
       
-        if encoding in self.big_endian_encodings:
-            self._MQOpts__list[0][2] = ">" + self._MQOpts__list[0][2]
-                
-        pymqi.MQOpts.__init__(*(self, tuple(self._MQOpts__list)))
-        pymqi.MQOpts.unpack(self, buff[:pymqi.CMQCFC.MQCFSF_STRUC_LENGTH_FIXED])
-        
-        string_value = buff[pymqi.CMQCFC.MQCFSF_STRUC_LENGTH_FIXED:pymqi.CMQCFC.MQCFSF_STRUC_LENGTH_FIXED + self["FilterValueLength"]]
+        self.unpack_fixed(buff, encoding)
+
         if self["FilterValueLength"] == 0:
+            string_value = _as_bytes(buff[pymqi.CMQCFC.MQCFSF_STRUC_LENGTH_FIXED:])
             self["FilterValueLength"] = len(string_value)
         else:
-            string_value = buff[pymqi.CMQCFC.MQCFSF_STRUC_LENGTH_FIXED:pymqi.CMQCFC.MQCFSF_STRUC_LENGTH_FIXED + self["FilterValueLength"]]
-        
-        
-        self.opts = self._MQOpts__list + (["FilterValue", string_value, "%is" % self["FilterValueLength"]], )
+            string_value = _as_bytes(buff[pymqi.CMQCFC.MQCFSF_STRUC_LENGTH_FIXED:pymqi.CMQCFC.MQCFSF_STRUC_LENGTH_FIXED + self["FilterValueLength"]])
+
+
         if self["StrucLength"] == pymqi.CMQCFC.MQCFSF_STRUC_LENGTH_FIXED or self["StrucLength"] == 0:
             self["StrucLength"] = pymqi.CMQCFC.MQCFSF_STRUC_LENGTH_FIXED +  len(string_value)
-        #save the current values
-        saved_values = self.get()
-        #apply the new opts
-        pymqi.MQOpts.__init__(*(self, tuple(self.opts)))
-        #set from saved values
-        self.set(**saved_values)   
+
+        self._set_tail("FilterValue", string_value)
 
 cfsf = CFSF
 
@@ -443,62 +676,51 @@ class CFST(MQOptsWithEncoding):
 
     Construct a CFST Structure with default values as per MQI. The
     default values may be overridden by the optional keyword arguments   
-    'kw'. 
+    'kw'.
     """
 
+    _FIELDS = ('Type', 'StrucLength', 'Parameter', 'CodedCharSetId', 'StringLength')
+    _STRUCT_NE = struct.Struct("5" + pymqi.MQLONG_TYPE)
+    _STRUCT_BE = struct.Struct(">5" + pymqi.MQLONG_TYPE)
+
     def __init__(self, **kw):
-        pymqi.MQOpts.__init__(*(self, (
-            ['Type', pymqi.CMQCFC.MQCFT_STRING, pymqi.MQLONG_TYPE],
-            ['StrucLength', pymqi.CMQCFC.MQCFST_STRUC_LENGTH_FIXED, pymqi.MQLONG_TYPE],
-            ['Parameter', 0, pymqi.MQLONG_TYPE],
-            ['CodedCharSetId', pymqi.CMQC.MQCCSI_DEFAULT, pymqi.MQLONG_TYPE],
-            ['StringLength', 0, pymqi.MQLONG_TYPE]
+        pymqi.MQOpts.__init__(self, (
+            ['Type', _MQCFT_STRING, _MQLONG_TYPE],
+            ['StrucLength', _MQCFST_STRUC_LENGTH_FIXED, _MQLONG_TYPE],
+            ['Parameter', 0, _MQLONG_TYPE],
+            ['CodedCharSetId', _MQCCSI_DEFAULT, _MQLONG_TYPE],
+            ['StringLength', 0, _MQLONG_TYPE]
             #['String', '','1s']
-            )), **kw)   
+            ), **kw)   
         
     def set_string(self, string_value):
         """set_string(value)
              
         Set the variable length string and update the structure accordingly."""
-        #apply(pymqi.MQOpts.__init__, (self, tuple(self._MQOpts__list)), )
         self["StringLength"] = len(string_value)
-        
-        self.opts = self._MQOpts__list + (["String", string_value, "%is" % self["StringLength"]], )
-        if self["StrucLength"] == pymqi.CMQCFC.MQCFST_STRUC_LENGTH_FIXED or self["StrucLength"] == 0: 
-            self["StrucLength"] = pymqi.CMQCFC.MQCFST_STRUC_LENGTH_FIXED +  len(string_value)
-        #save the current values
-        saved_values = self.get()
-        #apply the new opts
-        pymqi.MQOpts.__init__(*(self, tuple(self.opts)))
-        #set from saved values
-        self.set(**saved_values)
-            
+
+        if self["StrucLength"] == _MQCFST_STRUC_LENGTH_FIXED or self["StrucLength"] == 0:
+            self["StrucLength"] = _MQCFST_STRUC_LENGTH_FIXED +  len(string_value)
+
+        self._set_tail("String", string_value)
+
     def unpack(self, buff, encoding=None):
         """unpack(buff, encoding)
         
         Unpack a buffer into the CFST structure."""
    
-        if encoding in self.big_endian_encodings:
-            self._MQOpts__list[0][2] = ">" + self._MQOpts__list[0][2]
-                
-        pymqi.MQOpts.__init__(*(self, tuple(self._MQOpts__list)))
-        pymqi.MQOpts.unpack(self, buff[:pymqi.CMQCFC.MQCFST_STRUC_LENGTH_FIXED])
-        
-        string_value = buff[pymqi.CMQCFC.MQCFST_STRUC_LENGTH_FIXED:]
+        self.unpack_fixed(buff, encoding)
+
         if self["StringLength"] == 0:
+            string_value = _as_bytes(buff[_MQCFST_STRUC_LENGTH_FIXED:])
             self["StringLength"] = len(string_value)
         else:
-            string_value = buff[pymqi.CMQCFC.MQCFST_STRUC_LENGTH_FIXED:pymqi.CMQCFC.MQCFST_STRUC_LENGTH_FIXED + self["StringLength"]]
+            string_value = _as_bytes(buff[_MQCFST_STRUC_LENGTH_FIXED:_MQCFST_STRUC_LENGTH_FIXED + self["StringLength"]])
         
-        self.opts = self._MQOpts__list + (["String", string_value, "%is" % self["StringLength"]], )
-        if self["StrucLength"] == pymqi.CMQCFC.MQCFST_STRUC_LENGTH_FIXED or self["StrucLength"] == 0: 
-            self["StrucLength"] = pymqi.CMQCFC.MQCFST_STRUC_LENGTH_FIXED +  len(string_value)
-        #save the current values
-        saved_values = self.get()
-        #apply the new opts
-        pymqi.MQOpts.__init__(*(self, tuple(self.opts)))
-        #set from saved values
-        self.set(**saved_values)
+        if self["StrucLength"] == _MQCFST_STRUC_LENGTH_FIXED or self["StrucLength"] == 0:
+            self["StrucLength"] = _MQCFST_STRUC_LENGTH_FIXED +  len(string_value)
+
+        self._set_tail("String", string_value)
 
 cfst = CFST        
                     
@@ -509,122 +731,182 @@ class CFSL(MQOptsWithEncoding):
     default values may be overridden by the optional keyword arguments
     'kw'."""
     
-    string_list = []
+    _FIELDS = ('Type', 'StrucLength', 'Parameter', 'CodedCharSetId',
+               'Count', 'StringLength')
+    _STRUCT_NE = struct.Struct("6" + pymqi.MQLONG_TYPE)
+    _STRUCT_BE = struct.Struct(">6" + pymqi.MQLONG_TYPE)
 
     def __init__(self, **kw):
         self.string_list = []
-        pymqi.MQOpts.__init__(*(self, (
-            ['Type', pymqi.CMQCFC.MQCFT_STRING_LIST, pymqi.MQLONG_TYPE],
-            ['StrucLength', pymqi.CMQCFC.MQCFSL_STRUC_LENGTH_FIXED, pymqi.MQLONG_TYPE],
-            ['Parameter', 0, pymqi.MQLONG_TYPE],
-            ['CodedCharSetId', pymqi.CMQC.MQCCSI_DEFAULT, pymqi.MQLONG_TYPE],
-            ['Count', 0, pymqi.MQLONG_TYPE],
-            ['StringLength', 0, pymqi.MQLONG_TYPE]
+        self._str_buf = bytearray()
+        self._tail_stale = False
+        pymqi.MQOpts.__init__(self, (
+            ['Type', _MQCFT_STRING_LIST, _MQLONG_TYPE],
+            ['StrucLength', _MQCFSL_STRUC_LENGTH_FIXED, _MQLONG_TYPE],
+            ['Parameter', 0, _MQLONG_TYPE],
+            ['CodedCharSetId', _MQCCSI_DEFAULT, _MQLONG_TYPE],
+            ['Count', 0, _MQLONG_TYPE],
+            ['StringLength', 0, _MQLONG_TYPE]
             #['String', '','1s']
-            )), **kw)   
+            ), **kw)   
   
     def add_string(self, value):
         """add_string(value)
-              
-        Add a string to the list and update the structure accordingly."""
+
+        Add a string to the list and update the structure accordingly.
+
+        Only the new string is padded (or truncated) to StringLength and
+        appended to a growing bytearray - the previous code rebuilt the
+        whole list on every add.  The opts rebuild is deferred to
+        finalize()."""
+
         self.string_list.append(value)
         if self["StringLength"] == 0:
             self["StringLength"] =  len(value)
-        
+
         self["Count"] = self["Count"] + 1
-        self["StrucLength"] =  pymqi.CMQCFC.MQCFSL_STRUC_LENGTH_FIXED + (self["StringLength"] *  self["Count"])
-        
-        string_value = ""
-        for s in self.string_list:
-            if len(s) < self["StringLength"]:
-                s = s + " " * self["StringLength"] - len(s)
-            if len(s) > self["StringLength"]:
-                s = s[:self["StringLength" - 1]]
-                
-            string_value = string_value + s  
-            
-        if hasattr(self, "StringList"):
-            self["StringList"] = string_value
-            self.opts = self._MQOpts__list[:-1] + (["StringList", string_value, "%is" % len(string_value)], )
-        else:
-            self.opts = self._MQOpts__list + (["StringList", string_value, "%is" % len(string_value)], )
-             
-        saved_values = self.get()
-       
-        #apply the new opts
-        pymqi.MQOpts.__init__(*(self, tuple(self.opts)))
-        #set from saved values
-        self.set(**saved_values)               
+        self["StrucLength"] =  _MQCFSL_STRUC_LENGTH_FIXED + (self["StringLength"] *  self["Count"])
+
+        string_length = self["StringLength"]
+        self._str_buf.extend(pymqi.py3str2bytes(value).ljust(string_length, b" ")[:string_length])
+        self._tail_stale = True
+
+    def finalize(self):
+        """finalize()
+
+        Install the accumulated string list as the trailing field.  Called
+        automatically by pack() so add_string() stays O(1) per add."""
+
+        if self._tail_stale:
+            self._set_tail("StringList", bytes(self._str_buf))
+            self._tail_stale = False
+
+    def pack(self, encoding=None):
+        """pack(encoding)
+
+        Finalize any pending add_string() calls before packing."""
+
+        self.finalize()
+        return MQOptsWithEncoding.pack(self, encoding)
+
+    def pack_into(self, buf, offset, encoding=None):
+        """pack_into(buf, offset, encoding)
+
+        Finalize any pending add_string() calls before packing."""
+
+        self.finalize()
+        return MQOptsWithEncoding.pack_into(self, buf, offset, encoding)
+
+    def strings(self, decoder=None):
+        """strings(decoder)
+
+        Return the list entries as StringLength-sized slices of the raw
+        StringList blob, each optionally passed through 'decoder'.
+        Decoding per slice keeps the entries correct for variable-width
+        codecs, where decoding the concatenated blob would not."""
+
+        raw = self["StringList"]
+        string_length = self["StringLength"]
+        if string_length == 0:
+            return []
+        entries = [raw[i:i + string_length] for i in range(0, len(raw), string_length)]
+        if decoder is not None:
+            entries = [decoder(entry) for entry in entries]
+        return entries
 
-            
     def unpack(self, buff, encoding=None):
         """unpack(buff, encoding)
-        
+
         Unpack a buffer into the CFSL structure."""
-          
-        if encoding in self.big_endian_encodings:
-            self._MQOpts__list[0][2] = ">" + self._MQOpts__list[0][2]
-                
-        pymqi.MQOpts.__init__(*(self, tuple(self._MQOpts__list)))
-        pymqi.MQOpts.unpack(self, buff[:pymqi.CMQCFC.MQCFSL_STRUC_LENGTH_FIXED])
-        
-        string_value = buff[pymqi.CMQCFC.MQCFSL_STRUC_LENGTH_FIXED:]
+
+        self.unpack_fixed(buff, encoding)
+
+        count = self["Count"]
         if self["StringLength"] == 0:
-            self["StringLength"] = len(string_value)
+            string_value = _as_bytes(buff[_MQCFSL_STRUC_LENGTH_FIXED:])
+            if count > 0:
+                self["StringLength"] = len(string_value) // count
+            else:
+                self["StringLength"] = len(string_value)
         else:
-            string_value = buff[pymqi.CMQCFC.MQCFSL_STRUC_LENGTH_FIXED:pymqi.CMQCFC.MQCFSL_STRUC_LENGTH_FIXED + self["StringLength"]]
-        
-        self.opts = self._MQOpts__list + (["StringList", string_value, "%is" % self["StringLength"]], )
-        if self["StrucLength"] == pymqi.CMQCFC.MQCFSL_STRUC_LENGTH_FIXED or self["StrucLength"] == 0: 
-            self["StrucLength"] = pymqi.CMQCFC.MQCFSL_STRUC_LENGTH_FIXED +  len(string_value)
-        #save the current values
-        saved_values = self.get()
-        #apply the new opts
-        pymqi.MQOpts.__init__(*(self, tuple(self.opts)))
-        #set from saved values
-        self.set(**saved_values)
-        
+            string_value = _as_bytes(buff[_MQCFSL_STRUC_LENGTH_FIXED:_MQCFSL_STRUC_LENGTH_FIXED + self["StringLength"] * count])
+
+        if self["StrucLength"] == _MQCFSL_STRUC_LENGTH_FIXED or self["StrucLength"] == 0:
+            self["StrucLength"] = _MQCFSL_STRUC_LENGTH_FIXED +  len(string_value)
+
+        self._str_buf = bytearray(string_value)
+        self._set_tail("StringList", string_value)
+
 cfsl = CFSL
 
+#  stringifyKeys is a staticmethod backed by dicts built once at pymqi import
+#  time; bind it here so stringify_keys/__repr__ need not build a
+#  PCFExecute instance per call.
+_stringify_keys = pymqi.PCFExecute.stringifyKeys
+
+#  Jump table for the response demultiplex loop: parameter type -> name of
+#  the field carrying the value.  One dict lookup replaces the chained
+#  parm_type comparisons previously run for every parameter of every
+#  response struct.
+_EXTRACTORS = {
+    pymqi.CMQCFC.MQCFT_INTEGER: "Value",
+    pymqi.CMQCFC.MQCFT_STRING: "String",
+    pymqi.CMQCFC.MQCFT_INTEGER_LIST: "IntegerList",
+    pymqi.CMQCFC.MQCFT_STRING_LIST: "StringList",
+    pymqi.CMQCFC.MQCFT_BYTE_STRING: "String",
+}
+
+#  Structure types that carry a response header rather than a value.
+_HEADER_TYPES = frozenset([
+    pymqi.CMQCFC.MQCFT_RESPONSE,
+    pymqi.CMQCFC.MQCFT_XR_ITEM,
+    pymqi.CMQCFC.MQCFT_XR_MSG,
+    pymqi.CMQCFC.MQCFT_XR_SUMMARY,
+])
+
 class PCFCommandResponse(object):
     """PCFCommandResponse(struct_list)
-    
+
     Helper class to PCF command responses. Returned by the PCFCommand.execute_command method."""
-   
+
     def __init__(self, struct_list=[]):
         self._struct_list = struct_list
         #self._parm_structs = []
         self._headers = []
         self._header = None
         self._parms = []
+        self._columns = {}
         if len(self._struct_list) > 0:
+            columns = self._columns
             for pcf_s in self._struct_list:
                 pcf_dict = {}
                 for pcf_st in pcf_s:
                     parm_type = pcf_st["Type"]
-                    if parm_type == pymqi.CMQCFC.MQCFT_RESPONSE or parm_type == pymqi.CMQCFC.MQCFT_XR_ITEM or parm_type == pymqi.CMQCFC.MQCFT_XR_MSG or parm_type == pymqi.CMQCFC.MQCFT_XR_SUMMARY:
+                    value_field = _EXTRACTORS.get(parm_type)
+                    if value_field is not None:
+                        parm = pcf_st["Parameter"]
+                        value = pcf_st[value_field]
+                        pcf_dict[parm] = value
+                        columns.setdefault(parm, []).append(value)
+                    elif parm_type in _HEADER_TYPES:
                         self._headers.append(pcf_st)
                         if self._header is None:
                             self._header = pcf_st
                         if parm_type == pymqi.CMQCFC.MQCFT_XR_SUMMARY:
                             break
-                    elif parm_type == pymqi.CMQCFC.MQCFT_INTEGER:
-                        pcf_dict[pcf_st["Parameter"]] = pcf_st["Value"]
-                    elif parm_type == pymqi.CMQCFC.MQCFT_STRING:
-                        pcf_dict[pcf_st["Parameter"]] = pcf_st["String"]
-                    elif parm_type == pymqi.CMQCFC.MQCFT_INTEGER_LIST:
-                        pcf_dict[pcf_st["Parameter"]] = pcf_st["IntegerList"]
-                    elif parm_type == pymqi.CMQCFC.MQCFT_STRING_LIST:
-                        pcf_dict[pcf_st["Parameter"]] = pcf_st["StringList"]
-                    elif parm_type == pymqi.CMQCFC.MQCFT_BYTE_STRING:
-                        pcf_dict[pcf_st["Parameter"]] = pcf_st["String"]                        
                     else:
                         print("Response:", pymqi.PYIFError("Unsupported parameter type. Type: {}".format(parm_type)))
                         raise pymqi.PYIFError("Unsupported parameter type. Type: {}".format(parm_type))
-                if len(pcf_dict) > 0:        
+                if len(pcf_dict) > 0:
                     self._parms.append(pcf_dict)
         else:
             raise pymqi.PYIFError("PCF Structure List empty.")
+
+        # Parsed once, never mutated afterwards: freeze as tuples so
+        # consumers iterate the cheaper immutable sequence and the API makes
+        # the read-only intent explicit.
+        self._parms = tuple(self._parms)
+        self._headers = tuple(self._headers)
         
     @property
     def struct_list(self):
@@ -637,7 +919,15 @@ class PCFCommandResponse(object):
     @property
     def parms(self):
         return self._parms
-    
+
+    @property
+    def columns(self):
+        """Columnar view of the responses: {parameter: [value, ...]}.
+
+        Pulling one attribute across thousands of responses is a single
+        dict lookup here instead of a lookup per response dict in parms."""
+        return self._columns
+
     @property
     def header(self):
         return self._header
@@ -670,14 +960,17 @@ class PCFCommandResponse(object):
     def stringify_keys(self, parms=None):
         if parms is None:
             parms =  self._parms
-        pcf = pymqi.PCFExecute(None)
-        str_parms = []
-        for s in parms:
-            str_parms.append(pcf.stringifyKeys(s))
-        
-        return str_parms 
-    
+        return [_stringify_keys(s) for s in parms]
+
+    # Set verbose=False (per instance or on the class) for a cheap
+    # one-line summary instead of stringifying every parameter - the
+    # comp/reason codes come straight off the header.
+    verbose = True
+
     def __repr__(self):
+        if not self.verbose:
+            return "PCFCommandResponse(comp_code=%s, reason_code=%s, messages=%s)" % (
+                self.comp_code, self.reason_code, len(self._headers))
         return str(self.stringify_keys())
     
     # def __getitem__(self, key):
@@ -705,12 +998,119 @@ class PCFCommandResponse(object):
         return it
     
 
+class PCFParms(object):
+    """PCFParms()
+
+    Structure-of-arrays alternative to the list-of-tuples parameter API.
+    Parameter ids, kind markers and values live in three parallel arrays,
+    so a large parameter list allocates no per-parameter tuple and the
+    encoder dispatches on a small int instead of the value's type.
+    Accepted by pack_bag and execute_command wherever a parm_list is;
+    the add methods chain:
+
+        parms = PCFParms().add_str(pymqi.CMQC.MQCA_Q_NAME, b"SYSTEM.*")
+        parms.add_int_list(pymqi.CMQCFC.MQIACF_Q_ATTRS, [...])
+    """
+
+    _INT = 0
+    _STR = 1
+    _LIST = 2
+
+    def __init__(self):
+        self.ids = array.array(pymqi.MQLONG_TYPE)
+        self.kinds = array.array("b")
+        self.values = []
+
+    def add_int(self, parm, value):
+        """add_int(parm, value)
+
+        Append an integer parameter; returns self."""
+
+        self.ids.append(parm)
+        self.kinds.append(self._INT)
+        self.values.append(value)
+        return self
+
+    def add_str(self, parm, value):
+        """add_str(parm, value)
+
+        Append a string parameter; returns self."""
+
+        self.ids.append(parm)
+        self.kinds.append(self._STR)
+        self.values.append(value)
+        return self
+
+    def add_int_list(self, parm, values):
+        """add_int_list(parm, values)
+
+        Append an integer-list parameter; returns self."""
+
+        self.ids.append(parm)
+        self.kinds.append(self._LIST)
+        self.values.append(values)
+        return self
+
+    def __len__(self):
+        return len(self.ids)
+
+    def __iter__(self):
+        # (parm, value) pairs, for callers written against the tuple API.
+        return iter(zip(self.ids, self.values))
+
+
+class PendingCommand(object):
+    """PendingCommand(pcf, dyn_queue, msg_id)
+
+    Handle for a PCF request that has been put but not yet reaped,
+    returned by PCFCommand.execute_command_async.  result() collects the
+    responses (blocking until the command server replies) and caches
+    them, so it can be called more than once."""
+
+    def __init__(self, pcf, dyn_queue, msg_id):
+        self._pcf = pcf
+        self._dyn_queue = dyn_queue
+        self._msg_id = msg_id
+        self._response = None
+
+    def result(self):
+        """result()
+
+        Reap and return the PCFCommandResponse for this request."""
+
+        if self._response is None:
+            self._response = self._pcf._reap_response(self._dyn_queue, self._msg_id)
+        return self._response
+
+
+class CompiledCommand(object):
+    """CompiledCommand(command, parm_list, msg_body)
+
+    A PCF request packed ahead of time by PCFCommand.compile_command.
+    Holds the ready-to-put message body plus the command and parameters
+    it was built from (kept for cache invalidation)."""
+
+    def __init__(self, command, parm_list, msg_body):
+        self.command = command
+        self.parm_list = parm_list
+        self.msg_body = msg_body
+
+
+#  Commands that change queue definitions - anything in this set drops the
+#  matching inquire_q cache entries (see enable_cache).
+_MUTATING_Q_COMMANDS = frozenset([pymqi.CMQCFC.MQCMD_CREATE_Q,
+                    pymqi.CMQCFC.MQCMD_CHANGE_Q,
+                    pymqi.CMQCFC.MQCMD_DELETE_Q,
+                    pymqi.CMQCFC.MQCMD_COPY_Q,
+                    pymqi.CMQCFC.MQCMD_MOVE_Q])
+
+
 class PCFCommand(object):
     """PCFCommand(qmgr, ccsid, encoding)
-    
+
     PCFCommand class that handles numeric encoding, variable length pcf strutures and complex pcf bags."""
-    
-    big_endian_encodings = [pymqi.CMQC.MQENC_INTEGER_NORMAL,
+
+    big_endian_encodings = frozenset([pymqi.CMQC.MQENC_INTEGER_NORMAL,
                         pymqi.CMQC.MQENC_DECIMAL_NORMAL,
                         pymqi.CMQC.MQENC_FLOAT_IEEE_NORMAL,
                         pymqi.CMQC.MQENC_FLOAT_S390,
@@ -730,65 +1130,190 @@ class PCFCommand(object):
                         #785
                         pymqi.CMQC.MQENC_INTEGER_NORMAL +
                         pymqi.CMQC.MQENC_DECIMAL_NORMAL +
-                        pymqi.CMQC.MQENC_FLOAT_S390]
+                        pymqi.CMQC.MQENC_FLOAT_S390])
 
 
-    def __init__(self, qmgr, ccsid=pymqi.CMQC.MQCCSI_DEFAULT, encoding=pymqi.CMQC.MQENC_NATIVE, ccsid_str=None, convert=False, zos=False, command_queue="SYSTEM.ADMIN.COMMAND.QUEUE"):
+    def __init__(self, qmgr, ccsid=pymqi.CMQC.MQCCSI_DEFAULT, encoding=pymqi.CMQC.MQENC_NATIVE, ccsid_str=None, convert=False, zos=False, command_queue="SYSTEM.ADMIN.COMMAND.QUEUE", threaded_reader=False):
         self.qmgr = qmgr
         self.zos = zos
-        
-        if ccsid is None and encoding is None and zos:
-            self.ccsid = 37
-            self.encoding = 785
-            self.convert = True
-        else:
-            if ccsid is None:
-                if zos:
-                    self.ccsid = 37
-                else:
-                    self.ccsid = pymqi.CMQC.MQCCSI_DEFAULT
-            else:
-                if ccsid == 0:    
-                    if zos:
-                        self.ccsid = 37
-                    else:    
-                        self.ccsid = pymqi.CMQC.MQCCSI_DEFAULT
-                else:
-                    self.ccsid = ccsid
-               
-            if encoding is None:
-                if zos:
-                    self.encoding = 785
-                else:
-                    self.encoding = pymqi.CMQC.MQENC_NATIVE
-            else:
-                if encoding == 0:
-                    if zos:
-                        self.encoding = 785
-                    else:
-                        self.encoding = pymqi.CMQC.MQENC_NATIVE
-                else:
-                    self.encoding = encoding
-            
-            if zos:
-                self.convert = True
-            else:
-                self.convert = convert        
 
-            if ccsid_str is None:
-                self.ccsid_str = "{:03d}".format(self.ccsid)
-            else:
-                self.ccsid_str = ccsid_str
-        
+        # Opt-in: overlap the reply MQGETs with the unpacking on a reader
+        # thread.  Only enable this on a connection established with
+        # MQCNO_HANDLE_SHARE_BLOCK (PCFConnectionPool connects that way) -
+        # MQ connection handles are thread-affine by default and a second
+        # thread's MQGET fails with MQRC_HCONN_ERROR.
+        self.threaded_reader = threaded_reader
+
+        # None and 0 both mean "use the platform default", so the old
+        # nested ccsid/encoding/zos cascade collapses to one expression
+        # per attribute.
+        self.ccsid = ccsid or (37 if zos else pymqi.CMQC.MQCCSI_DEFAULT)
+        self.encoding = encoding or (785 if zos else pymqi.CMQC.MQENC_NATIVE)
+        self.convert = True if zos else convert
+        self.ccsid_str = ccsid_str or "{:03d}".format(self.ccsid)
+
+
         if command_queue is None:
             self.command_queue = b"SYSTEM.ADMIN.COMMAND.QUEUE"
         else:
             self.command_queue = command_queue
 
-        #print("self.ccsid:" + str(self.ccsid))
-        #print("self.encoding:" + str(self.encoding))
-        #print("self.convert:" + str(self.convert))
-             
+        # Decided once per command object: a swap is only ever needed when the
+        # target encoding is big-endian and the host is little-endian.  On the
+        # common Linux<->Linux / Windows<->Windows deployments _wire_encoding
+        # stays None and every pack/unpack below takes the native fast path
+        # without rescanning big_endian_encodings per field.
+        self._need_swap = (self.encoding in self.big_endian_encodings
+                           and sys.byteorder == "little")
+        self._wire_encoding = self.encoding if self._need_swap else None
+
+        self._ebcdic_in_table, self._ebcdic_out_table = _ebcdic_tables(self.ccsid)
+
+        # Codec entries for the non-table fallback, resolved on first use so
+        # that a ccsid_str with no matching codec only fails if conversion is
+        # actually attempted.  codecs.getencoder/getdecoder return the
+        # underlying C functions, skipping the registry lookup that
+        # str.encode(name) repeats on every call.
+        self._codec_encoder = None
+        self._codec_decoder = None
+
+        # Dynamic reply queue, opened lazily and shared by every command
+        # issued through this object (see _get_reply_queue).
+        self._reply_queue = None
+        self._reply_queue_name = None
+
+        # Reply-size high-water mark, passed to get() as the buffer size.
+        # The MQGET buffer itself lives inside the pymqe extension, so the
+        # persistent part under Python's control is this size hint: sized
+        # right, each reply costs one MQGET instead of pymqi's 4 KiB
+        # truncate-and-retry pair.  Grows to the largest reply seen.
+        self._reply_buf_len = 100 * 1024
+
+        # Opt-in inquire_q result cache - stays off until enable_cache.
+        self._inquire_cache = None
+        self._inquire_cache_ttl = 0
+        self._inquire_cache_maxsize = 0
+
+        # Also decided once: conversion is a no-op when it is switched off or
+        # when the target ccsid is the queue manager default (0), i.e. the
+        # messages are already in the host codepage.  Every conversion site
+        # below checks this flag instead of re-deriving it per string.
+        self._need_convert = bool(self.convert) and self.ccsid != pymqi.CMQC.MQCCSI_DEFAULT
+
+    def _decode_string(self, value):
+        """_decode_string(value)
+
+        Codepage-convert an inbound string field.  Single-byte EBCDIC
+        codepages go through one bytes.translate pass plus a latin-1
+        decode; anything else falls back to the codec."""
+
+        if self._ebcdic_in_table is not None:
+            return value.translate(self._ebcdic_in_table).decode("latin-1")
+        if self._codec_decoder is None:
+            self._codec_decoder = codecs.getdecoder(self.ccsid_str)
+        return self._codec_decoder(value)[0]
+
+    def _encode_string(self, value):
+        """_encode_string(value)
+
+        Codepage-convert an outbound string for the target queue manager,
+        using the translate table where the ccsid allows it."""
+
+        if self._ebcdic_out_table is not None:
+            if not isinstance(value, bytes):
+                value = value.encode("latin-1")
+            return value.translate(self._ebcdic_out_table)
+        if self._codec_encoder is None:
+            self._codec_encoder = codecs.getencoder(self.ccsid_str)
+        return self._codec_encoder(value)[0]
+
+
+    def _build_cfin(self, parm, parm_vals):
+        """_build_cfin(parm, parm_vals)
+
+        Build a CFIN for a single integer parameter value."""
+
+        cf_p = CFIN()
+        cf_p["Parameter"] = parm
+        cf_p["Value"] = parm_vals
+        return cf_p
+
+    def _build_cfst(self, parm, parm_vals):
+        """_build_cfst(parm, parm_vals)
+
+        Build a CFST for a single string parameter value."""
+
+        cf_p = CFST()
+        cf_p["CodedCharSetId"] = self.ccsid
+        cf_p["Parameter"] = parm
+        if self._need_convert:
+            cf_p.set_string(self._encode_string(parm_vals))
+        else:
+            cf_p.set_string(parm_vals)
+        return cf_p
+
+    def _build_cf_list(self, parm, parm_vals):
+        """_build_cf_list(parm, parm_vals)
+
+        Build a CFIL or CFSL from a list value, keyed off the type of
+        its first element.  Empty lists build nothing and are left out
+        of the header's ParameterCount."""
+
+        if len(parm_vals) == 0:
+            return None
+        if type(parm_vals[0]) is int:
+            cf_p = CFIL()
+            cf_p["Parameter"] = parm
+            cf_p.add_integers(parm_vals, self._wire_encoding)
+        elif type(parm_vals[0]) in _STR_TYPES:
+            cf_p = CFSL()
+            cf_p["CodedCharSetId"] = self.ccsid
+            cf_p["Parameter"] = parm
+            for p in parm_vals:
+                if self._need_convert:
+                    cf_p.add_string(self._encode_string(p))
+                else:
+                    cf_p.add_string(p)
+        else:
+            raise pymqi.PYIFError("Unknown parameter type. Expected int, str or float.")
+        return cf_p
+
+    # Exact value type -> builder, looked up in O(1) by pack_bag instead of
+    # walking an if/elif chain per parameter.
+    _BUILDERS = {
+        int: _build_cfin,
+        str: _build_cfst,
+        bytes: _build_cfst,
+        list: _build_cf_list,
+    }
+
+    def _get_reply_queue(self):
+        """_get_reply_queue()
+
+        Open the dynamic reply queue on first use and reuse it for every
+        subsequent command.  The MQOPEN/MQCLOSE round-trip per command
+        dominated the latency of scripts issuing many short commands."""
+
+        if self._reply_queue is None:
+            dyn_od = pymqi.OD()
+            dyn_od.ObjectName = b"SYSTEM.DEFAULT.MODEL.QUEUE"
+            dyn_od.DynamicQName = b"PCF.REPLY.*"
+
+            dyn_input_open_options = pymqi.CMQC.MQOO_INPUT_SHARED + pymqi.CMQC.MQOO_INQUIRE + pymqi.CMQC.MQOO_FAIL_IF_QUIESCING
+            self._reply_queue = pymqi.Queue(self.qmgr, dyn_od, dyn_input_open_options)
+            self._reply_queue_name = dyn_od.ObjectName.strip()
+        return self._reply_queue, self._reply_queue_name
+
+    def close(self):
+        """close()
+
+        Close the cached dynamic reply queue, if one was opened."""
+
+        if self._reply_queue is not None:
+            self._reply_queue.close()
+            self._reply_queue = None
+            self._reply_queue_name = None
+
     def pack_bag(self, command=pymqi.CMQCFC.MQCMD_INQUIRE_Q_MGR, parm_list=[]):
         """
         Pack the pcf header and parameters into a buffer. 
@@ -797,129 +1322,95 @@ class PCFCommand(object):
         [{parm: parm_value}, (parm, parm_value) , cfcn] 
         """
          
-        pcf_header = cfh()
-        pcf_header["Type"] = pymqi.CMQCFC.MQCFT_COMMAND_XR
-        pcf_header["Command"] = command
-        pcf_header["Version"] = pymqi.CMQCFC.MQCFH_VERSION_3
-        pcf_header["ParameterCount"] = len(parm_list)
-        
-        out_buf = pcf_header.pack(encoding=self.encoding)
-        
+        # The wire encoding is passed positionally below - the keyword form
+        # re-parses the kwargs per structure for no gain on this hot path.
+        wire_encoding = self._wire_encoding
+
+        # CFH layout: 9 MQLONGs; Type is at offset 0, Version at 8 and
+        # Command at 12.  Everything else keeps the packed template
+        # defaults; ParameterCount (offset 32) is patched in
+        # _pack_assembled from the structures actually built, since an
+        # empty list value builds no structure.
+        if self._need_swap:
+            header_buf = bytearray(_CFH_TEMPLATE_BE)
+            long_struct = _LONG_BE
+        else:
+            header_buf = bytearray(_CFH_TEMPLATE_NE)
+            long_struct = _LONG_NE
+        long_struct.pack_into(header_buf, 0, pymqi.CMQCFC.MQCFT_COMMAND_XR)
+        long_struct.pack_into(header_buf, 8, pymqi.CMQCFC.MQCFH_VERSION_3)
+        long_struct.pack_into(header_buf, 12, command)
+
+        cf_parms = []
+
+        if type(parm_list) is PCFParms:
+            # SoA builder: three parallel arrays, dispatch on the kind
+            # marker - no per-parameter tuple unpacking.
+            kind_builders = (self._build_cfin, self._build_cfst, self._build_cf_list)
+            for parm, kind, parm_vals in zip(parm_list.ids, parm_list.kinds, parm_list.values):
+                cf_p = kind_builders[kind](parm, parm_vals)
+                if cf_p is not None:
+                    cf_parms.append(cf_p)
+            return self._pack_assembled(header_buf, cf_parms, wire_encoding)
+
         for parm_tpl in parm_list:
-            
-            if isinstance(parm_tpl, dict):
+
+            # Normalize to one (parm, parm_vals) pair so a single dispatch
+            # block below builds the structure for dicts and tuples alike.
+            tpl_type = type(parm_tpl)
+            if tpl_type is dict:
                 if len(parm_tpl) == 0:
                     raise pymqi.PYIFError("PCF Parameter tuple length is zero.")
-                
-                parm = list(parm_tpl.items())[0][0]
-                parm_vals = list(parm_tpl.items())[0][1]
-             
-                cf_p = None
-                #p_type = type(parm_vals)
-                #if p_type == type([]):
-                if isinstance(parm_vals, list):
-                    if len(parm_vals) > 0:
-                        #if type(parm_vals[0]) == type(0):
-                        if isinstance(parm_vals[0], int):                            
-                            # int list
-                            cf_p = CFIL()
-                            cf_p["Parameter"] = parm
-                            for p in parm_vals:
-                                cf_p.add_integer(p, encoding=self.encoding)
-                        #elif type(parm_vals[0]) == type(""):
-                        elif isinstance(parm_vals[0], str) or isinstance(parm_vals[0], bytes):
-                            # string
-                            cf_p = CFSL()
-                            cf_p["CodedCharSetId"] = self.ccsid
-                            cf_p["Parameter"] = parm
-                            for p in parm_vals:
-                                if self.convert:
-                                    cf_p.add_string(p.encode(self.ccsid_str))
-                                else:
-                                    cf_p.add_string(p)
-                        else:
-                            raise pymqi.PYIFError("Unknown parameter type. Expected int, str or float.")
-                else:
-                    #if p_type == type(0):
-                    if isinstance(parm_vals, int):                        
-                        cf_p = CFIN()
-                        cf_p["Parameter"] = parm
-                        cf_p["Value"] = parm_vals
-                    #elif p_type == type(""):
-                    elif isinstance(parm_vals, str) or isinstance(parm_vals, bytes):
-                        # string
-                        #print "parm_vals:", parm_vals
-                        #print "self.convert:", self.convert
-                        cf_p = CFST()
-                        cf_p["CodedCharSetId"] = self.ccsid
-                        cf_p["Parameter"] = parm
-                        
-                        if self.convert:
-                            cf_p.set_string(parm_vals.encode(self.ccsid_str))
-                        else:
-                            cf_p.set_string(parm_vals)
-                        
-                        #print cf_p
-                        
-                    else:
-                        raise pymqi.PYIFError("Unknown parameter type. Expected int, str or float.")
-                
-                out_buf = out_buf + cf_p.pack(encoding=self.encoding)
-                #print("outbuf:" + str(binascii.hexlify(out_buf)))
+                parm, parm_vals = next(iter(parm_tpl.items()))
+            elif tpl_type is tuple:
+                if len(parm_tpl) == 0:
+                    raise pymqi.PYIFError("PCF Parameter tuple length is zero.")
+                parm = parm_tpl[0]
+                parm_vals = parm_tpl[1]
+            elif isinstance(parm_tpl, MQOptsWithEncoding):
+                # Pre-built cfin/cfst/... structure - pack it as given.
+                # Plain MQOpts lacks finalize/get_length/pack_into, so only
+                # the encoding-aware PCF structures are accepted here.
+                cf_parms.append(parm_tpl)
+                continue
             else:
-                if isinstance(parm_tpl, tuple):
-                    if len(parm_tpl) == 0:
-                        raise pymqi.PYIFError("PCF Parameter tuple length is zero.")
-            
-                    parm = parm_tpl[0]
-                    parm_vals = parm_tpl[1]
-                 
-                    cf_p = None
-                    #p_type = type(parm_vals)
-                    if isinstance(parm_vals, list):
-                        if len(parm_vals) > 0:
-                            if isinstance(parm_vals[0], int): 
-                                
-                                # int list
-                                cf_p = CFIL()
-                                cf_p["Parameter"] = parm
-                                for p in parm_vals:
-                                    cf_p.add_integer(p, encoding=self.encoding)
-                            elif isinstance(parm_vals[0], str) or isinstance(parm_vals[0], bytes):
-                                # string
-                                cf_p = CFSL()
-                                cf_p["CodedCharSetId"] = self.ccsid
-                                cf_p["Parameter"] = parm
-                                for p in parm_vals:
-                                    cf_p.add_string(p)
-                            else:
-                                raise pymqi.PYIFError("Unknown parameter type. Expected int, str or float.")
-                    else:
-                        if isinstance(parm_vals, int):
-                            cf_p = CFIN()
-                            cf_p["Parameter"] = parm
-                            cf_p["Value"] = parm_vals
-                        elif isinstance(parm_vals, str) or isinstance(parm_vals, bytes):
-                            # string
-                            cf_p = CFST()
-                            cf_p["CodedCharSetId"] = self.ccsid
-                            cf_p["Parameter"] = parm
-                            cf_p.set_string(parm_vals)
-                        else:
-                            raise pymqi.PYIFError("Unknown parameter type. Expected int, str or float.")
-                    
-                    out_buf = out_buf + cf_p.pack(encoding=self.encoding)
-                    #print("outbuf:" + str(binascii.hexlify(out_buf)))
-                
-                else:
-                    if not isinstance(parm_tpl, pymqi.MQOpts):
-                        raise pymqi.PYIFError("Unknown parameter type. Expected cfin, cfst, etc.")
-                
-                #out_buf = out_buf + parm_tpl.pack(encoding=self.encoding)
-          
-        return out_buf
+                raise pymqi.PYIFError("Unknown parameter type. Expected cfin, cfst, etc.")
+
+            builder = self._BUILDERS.get(type(parm_vals))
+            if builder is None:
+                raise pymqi.PYIFError("Unknown parameter type. Expected int, str or float.")
+
+            cf_p = builder(self, parm, parm_vals)
+            if cf_p is not None:
+                cf_parms.append(cf_p)
+
+        return self._pack_assembled(header_buf, cf_parms, wire_encoding)
+
+    def _pack_assembled(self, header_buf, cf_parms, wire_encoding):
+        """_pack_assembled(header_buf, cf_parms, wire_encoding)
+
+        Size the request once, then pack every structure straight into the
+        preallocated buffer - no per-field bytes objects, no final join."""
+
+        # ParameterCount must match the structures that actually follow -
+        # skipped entries (empty list values) must not be counted.
+        long_struct = _LONG_BE if self._need_swap else _LONG_NE
+        long_struct.pack_into(header_buf, 32, len(cf_parms))
+
+        out_len = len(header_buf)
+        for cf_p in cf_parms:
+            cf_p.finalize()
+            out_len += cf_p.get_length()
+
+        out_buf = bytearray(out_len)
+        out_buf[:len(header_buf)] = header_buf
+        offset = len(header_buf)
+        for cf_p in cf_parms:
+            offset = cf_p.pack_into(out_buf, offset, wire_encoding)
+
+        return bytes(out_buf)
+
 
-    
     def unpack_bag(self, buff, convert=False):
         """unpack_bag(buff, encoding)
         
@@ -933,144 +1424,371 @@ class PCFCommand(object):
         pcf_dict = {}
         pcf_structs = []
         resp_cfh = cfh()
-        resp_cfh.unpack(buff[:36], encoding=self.encoding)
-        #print "Unpack - PCF Header:\n", resp_cfh, "----------------"
+        # One memoryview over the whole response plus an integer cursor -
+        # slicing the view is zero-copy, where new_buff = new_buff[struc_len:]
+        # re-copied the remaining tail on every parameter.
+        mem_buff = memoryview(buff)
+        buff_len = len(buff)
+        wire_encoding = self._wire_encoding
+        resp_cfh.unpack(mem_buff[:36], wire_encoding)
         pcf_structs.append(resp_cfh)
-        
-        new_buff =  buff[36:]
-        #print "Len:", len(new_buff)
-        done = False
-        if len(new_buff) == 0:
-            done = True
-        
-        while not done:
-            long_format = pymqi.MQLONG_TYPE
-            if self.encoding in self.big_endian_encodings:
-                long_format = ">" + pymqi.MQLONG_TYPE
 
-            parm_type = struct.unpack(long_format, new_buff[:4])[0]
-            struc_len = struct.unpack(long_format, new_buff[4:8])[0]
-            
-            if parm_type == pymqi.CMQCFC.MQCFT_INTEGER:
+        long_pair = _LONG_PAIR_BE if self._need_swap else _LONG_PAIR_NE
+
+        # Loop invariants as locals: LOAD_FAST instead of an attribute (or
+        # module-global) lookup per parameter.
+        need_convert = convert and self._need_convert
+        mqcft_integer = pymqi.CMQCFC.MQCFT_INTEGER
+        mqcft_string = pymqi.CMQCFC.MQCFT_STRING
+        mqcft_integer_list = pymqi.CMQCFC.MQCFT_INTEGER_LIST
+        mqcft_string_list = pymqi.CMQCFC.MQCFT_STRING_LIST
+        mqcft_byte_string = pymqi.CMQCFC.MQCFT_BYTE_STRING
+        structs_append = pcf_structs.append
+
+        for offset, parm_type, struc_len in _scan_pcf(mem_buff, 36, buff_len, long_pair):
+            new_buff = mem_buff[offset:offset + struc_len]
+
+            if parm_type == mqcft_integer:
                 resp_cfin = CFIN()
-                resp_cfin.unpack(new_buff[:struc_len], encoding=self.encoding)
-                pcf_structs.append(resp_cfin)
+                resp_cfin.unpack(new_buff, wire_encoding)
+                structs_append(resp_cfin)
                 pcf_dict[resp_cfin["Parameter"]] = resp_cfin["Value"]
-            elif parm_type == pymqi.CMQCFC.MQCFT_STRING:
+            elif parm_type == mqcft_string:
                 resp_cfst = CFST()
-                resp_cfst.unpack(new_buff[:struc_len], encoding=self.encoding)
-                if convert:
-                    resp_cfst["String"] = resp_cfst["String"].decode(self.ccsid_str)
+                resp_cfst.unpack(new_buff, wire_encoding)
+                if need_convert:
+                    # setattr rather than item assignment: the converted text
+                    # is a py3 string, which MQOpts.__setitem__ rejects.
+                    setattr(resp_cfst, "String", self._decode_string(resp_cfst["String"]))
                     if len(resp_cfst["String"]) != resp_cfst["StringLength"]:
                         print("Converted string length not equal to StringLength. Length: {} Expected Length: {} ".format(len(resp_cfst["String"]), resp_cfst["StringLength"]))
                         raise pymqi.PYIFError("Converted string length not equal to StringLength. Length: {} Expected Length: {} ".format(len(resp_cfst["String"]), resp_cfst["StringLength"]))
                         
-                pcf_structs.append(resp_cfst)
+                structs_append(resp_cfst)
                 pcf_dict[resp_cfst["Parameter"]] = resp_cfst["String"]
-            elif parm_type == pymqi.CMQCFC.MQCFT_INTEGER_LIST:
+            elif parm_type == mqcft_integer_list:
                 resp_cfil = CFIL()
-                resp_cfil.unpack(new_buff[:struc_len], encoding=self.encoding)
-                pcf_structs.append(resp_cfil)
+                resp_cfil.unpack(new_buff, wire_encoding)
+                structs_append(resp_cfil)
                 pcf_dict[resp_cfil["Parameter"]] = resp_cfil["IntegerList"]
-            elif parm_type == pymqi.CMQCFC.MQCFT_STRING_LIST:
+            elif parm_type == mqcft_string_list:
                 resp_cfsl = CFSL()
-                resp_cfsl.unpack(new_buff[:struc_len], encoding=self.encoding)
-                if convert:
-                    resp_cfsl["StringList"] = resp_cfsl["StringList"].decode(self.ccsid_str)
-                    if len(resp_cfsl["StringList"]) != resp_cfsl["StringLength"] * resp_cfsl["Count"]:
-                        print("Converted string length not equal to StringLength. Length: {} Expected Length: {} ".format(len(resp_cfsl["StringList"]), resp_cfsl["StringLength"] * resp_cfsl["Count"]))
-                        raise pymqi.PYIFError("Converted string length not equal to StringLength. Length: {} Expected Length: {} ".format(len(resp_cfsl["StringList"]), resp_cfsl["StringLength"] * resp_cfsl["Count"]))
-                   
-                pcf_structs.append(resp_cfsl)
-                pcf_dict[resp_cfsl["Parameter"]] = resp_cfsl["StringList"]    
-            elif parm_type == pymqi.CMQCFC.MQCFT_BYTE_STRING:
+                resp_cfsl.unpack(new_buff, wire_encoding)
+                structs_append(resp_cfsl)
+                if need_convert:
+                    # Decode per StringLength-sized slice; StringList itself
+                    # stays raw bytes.  A whole-blob decode (and its length
+                    # assertion) is wrong for variable-width codecs.
+                    pcf_dict[resp_cfsl["Parameter"]] = resp_cfsl.strings(self._decode_string)
+                else:
+                    pcf_dict[resp_cfsl["Parameter"]] = resp_cfsl["StringList"]
+            elif parm_type == mqcft_byte_string:
                 resp_cfbs = CFBS()
-                resp_cfbs.unpack(new_buff[:struc_len], encoding=self.encoding) 
-                pcf_structs.append(resp_cfbs)
-                pcf_dict[resp_cfbs["Parameter"]] = resp_cfbs["String"]    
+                resp_cfbs.unpack(new_buff, wire_encoding)
+                structs_append(resp_cfbs)
+                pcf_dict[resp_cfbs["Parameter"]] = resp_cfbs["String"]
             else:
-                print("Unsupported... (new_buff[:struc_len]:", binascii.hexlify(new_buff[:struc_len]))
+                print("Unsupported... (new_buff[:struc_len]:", binascii.hexlify(_as_bytes(new_buff)))
                 raise pymqi.PYIFError("Unsupported parameter type. Type: {}".format(parm_type))
-                
-            new_buff = new_buff[struc_len:]
-            
-            if len(new_buff) == 0:
-                done = True
-            
+
         return pcf_structs
 
     
     
-    def execute_command(self, command, parm_list=[]):
-        """execute_command(command, parm_list, convert)
-        
-        Execute a PCF command and optionally convert the codepage of the response messages."""
-        #print "self.convert:", self.convert
+    def _request_mqmd(self, reply_q_name):
+        """_request_mqmd(reply_q_name)
+
+        Build the message descriptor for an outbound PCF request."""
+
         mqmd = pymqi.md()
         mqmd["Format"] = pymqi.CMQC.MQFMT_ADMIN
         mqmd["MsgType"] = pymqi.CMQC.MQMT_REQUEST
-        #mqmd["ReplyToQ"] = "OUT3"
-        
         mqmd["CodedCharSetId"] = self.ccsid
-        
         mqmd["Encoding"] = self.encoding
-        
         mqmd["Expiry"] = 300
+        mqmd["ReplyToQ"] = reply_q_name
+        return mqmd
+
+    def execute_command(self, command, parm_list=[]):
+        """execute_command(command, parm_list, convert)
 
-        dynamic_queue_prefix = b"PCF.REPLY.*"
-        dyn_od = pymqi.OD()
-        dyn_od.ObjectName = b"SYSTEM.DEFAULT.MODEL.QUEUE"
-        dyn_od.DynamicQName = dynamic_queue_prefix
+        Execute a PCF command and optionally convert the codepage of the response messages."""
 
-        # Open the dynamic queue.
-        dyn_input_open_options = pymqi.CMQC.MQOO_INPUT_SHARED + pymqi.CMQC.MQOO_INQUIRE + pymqi.CMQC.MQOO_FAIL_IF_QUIESCING
-        dyn_queue = pymqi.Queue(self.qmgr, dyn_od, dyn_input_open_options)
-        dyn_queue_name = dyn_od.ObjectName.strip()
+        return self.execute_command_async(command, parm_list).result()
+
+    def execute_command_async(self, command, parm_list=[]):
+        """execute_command_async(command, parm_list)
+
+        Put a PCF request without waiting for the reply and return a
+        PendingCommand whose result() reaps it later.  Several requests
+        can be in flight on one connection - each put gets a unique
+        message id, the command server stamps it into the reply's
+        correlation id, and the reap matches on it with
+        MQMO_MATCH_CORREL_ID - so on a high-latency link the round-trips
+        overlap instead of running put-wait-put-wait:
+
+            pending = [pcf_c.execute_command_async(cmd, parms)
+                       for cmd, parms in work]
+            responses = [p.result() for p in pending]"""
+
+        dyn_queue, dyn_queue_name = self._get_reply_queue()
+
+        mqmd = self._request_mqmd(dyn_queue_name)
 
-        mqmd["ReplyToQ"] = dyn_queue_name
-    
         put_opts = pymqi.pmo(Options = pymqi.CMQC.MQPMO_NO_SYNCPOINT + pymqi.CMQC.MQPMO_FAIL_IF_QUIESCING)
 
         msg_body = self.pack_bag(command, parm_list)
 
-        #print("Msg Body:" + str(binascii.hexlify(msg_body)))
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("request: %s", binascii.hexlify(msg_body))
         self.qmgr.put1(self.command_queue, msg_body, mqmd, put_opts)
-        
+
+        self._invalidate_inquire_cache(command, parm_list)
+
+        return PendingCommand(self, dyn_queue, mqmd["MsgId"])
+
+    def compile_command(self, command, parm_list=[]):
+        """compile_command(command, parm_list)
+
+        Pack a command once into a reusable CompiledCommand.  PCF
+        encoding is pure, so a request that is reissued unchanged
+        (monitoring loops, benchmarks) can be packed ahead of time and
+        executed repeatedly with execute_compiled - per call only the
+        message descriptor is new."""
+
+        return CompiledCommand(command, parm_list, self.pack_bag(command, parm_list))
+
+    def execute_compiled(self, compiled):
+        """execute_compiled(compiled)
+
+        Put a CompiledCommand's prepacked request and reap its responses;
+        the per-call work is one MQMD and the put/get round-trip."""
+
+        dyn_queue, dyn_queue_name = self._get_reply_queue()
+
+        mqmd = self._request_mqmd(dyn_queue_name)
+
+        put_opts = pymqi.pmo(Options = pymqi.CMQC.MQPMO_NO_SYNCPOINT + pymqi.CMQC.MQPMO_FAIL_IF_QUIESCING)
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("request: %s", binascii.hexlify(compiled.msg_body))
+        self.qmgr.put1(self.command_queue, compiled.msg_body, mqmd, put_opts)
+
+        self._invalidate_inquire_cache(compiled.command, compiled.parm_list)
+
+        return self._reap_response(dyn_queue, mqmd["MsgId"])
+
+    def execute_commands(self, command_list):
+        """execute_commands(command_list)
+
+        Execute a batch of PCF commands in one pipeline: every request is
+        put on the command queue under a single unit of work and committed
+        together, then the replies are reaped per request by correlation
+        id.  The command server processes the requests in put order, so a
+        dependent sequence (create, inquire, delete) batches safely.
+        command_list holds (command, parm_list) pairs; returns one
+        PCFCommandResponse per entry, in order."""
+
+        dyn_queue, dyn_queue_name = self._get_reply_queue()
+
+        put_opts = pymqi.pmo(Options = pymqi.CMQC.MQPMO_SYNCPOINT + pymqi.CMQC.MQPMO_FAIL_IF_QUIESCING)
+
+        msg_ids = []
+        for command, parm_list in command_list:
+            mqmd = self._request_mqmd(dyn_queue_name)
+            msg_body = self.pack_bag(command, parm_list)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("request: %s", binascii.hexlify(msg_body))
+            self.qmgr.put1(self.command_queue, msg_body, mqmd, put_opts)
+            msg_ids.append(mqmd["MsgId"])
+        self.qmgr.commit()
+
+        for command, parm_list in command_list:
+            self._invalidate_inquire_cache(command, parm_list)
+
+        return [self._reap_response(dyn_queue, msg_id) for msg_id in msg_ids]
+
+    def execute_command_iter(self, command, parm_list=[]):
+        """execute_command_iter(command, parm_list)
+
+        Execute a PCF command and yield the parsed structures of each
+        response message as it arrives instead of collecting them all
+        first - constant memory on big enumerations (a wildcard
+        INQUIRE_Q_NAMES on a large queue manager).  Each item is one
+        message's structure list, the cfh first, as unpack_bag returns
+        it."""
+
+        pending = self.execute_command_async(command, parm_list)
+        return self._iter_responses(pending._dyn_queue, pending._msg_id)
+
+    def _reap_response(self, dyn_queue, correl_id):
+        """_reap_response(dyn_queue, correl_id)
+
+        Collect and unpack every response message for one request,
+        matching on the given correlation id."""
+
+        return PCFCommandResponse(list(self._iter_responses(dyn_queue, correl_id)))
+
+    def _iter_responses(self, dyn_queue, correl_id):
+        """_iter_responses(dyn_queue, correl_id)
+
+        Generator over the unpacked response messages for one request,
+        matching on the given correlation id."""
+
         get_opts = pymqi.gmo(Options = pymqi.CMQC.MQGMO_FAIL_IF_QUIESCING + pymqi.CMQC.MQGMO_NO_SYNCPOINT + pymqi.CMQC.MQGMO_WAIT)
 
         get_opts["Version"] = pymqi.CMQC.MQGMO_VERSION_2
         get_opts["MatchOptions"] = pymqi.CMQC.MQMO_MATCH_CORREL_ID
         get_opts["WaitInterval"] = 10 * 1000
 
-        done = False
-        out_structs = []
+        def _get_one():
+            """One reply MQGET sized from the high-water mark; returns
+            (message_data, ccsid)."""
 
-        while not done:
+            get_mqmd = pymqi.md()
+            get_mqmd["CorrelId"] = correl_id
             try:
+                message_data = dyn_queue.get(self._reply_buf_len, get_mqmd, get_opts)
+            except pymqi.MQMIError as e:
+                if e.reason != pymqi.CMQC.MQRC_TRUNCATED_MSG_FAILED:
+                    raise
+                # Oversized reply: it is still on the queue, so fall back
+                # to the measured two-call get and let the high-water
+                # mark catch up below.
                 get_mqmd = pymqi.md()
-                get_mqmd["CorrelId"] = mqmd["MsgId"]
-            
+                get_mqmd["CorrelId"] = correl_id
                 message_data = dyn_queue.get(None, get_mqmd, get_opts)
-                #print "Msg Data:", binascii.hexlify(message_data)
-                #Hack check to determine if text can be converted safely. 
-                if get_mqmd["CodedCharSetId"] != self.ccsid:
-                    rep_structs = self.unpack_bag(message_data, convert=False)
-                else:
-                    rep_structs = self.unpack_bag(message_data, convert=self.convert)
-                    
+            if len(message_data) > self._reply_buf_len:
+                self._reply_buf_len = len(message_data)
+            return message_data, get_mqmd["CodedCharSetId"]
+
+        def _unpack(message_data, msg_ccsid):
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("response: %s", binascii.hexlify(message_data))
+            #Hack check to determine if text can be converted safely.
+            if msg_ccsid != self.ccsid:
+                return self.unpack_bag(message_data, convert=False)
+            return self.unpack_bag(message_data, convert=self.convert)
+
+        if not self.threaded_reader:
+            # Default path: every MQGET runs on the calling thread.
+            # Connection handles are thread-affine unless the connection
+            # was made with MQCNO_HANDLE_SHARE_BLOCK, so this is the only
+            # path that is legal on a standard connection.
+            while True:
+                try:
+                    message_data, msg_ccsid = _get_one()
+                except pymqi.MQMIError as e:
+                    if e.reason == 2033:
+                        return
+                    raise
+                rep_structs = _unpack(message_data, msg_ccsid)
+                yield rep_structs
                 if rep_structs[0]["Control"] == pymqi.CMQCFC.MQCFC_LAST:
-                    done = True
-                out_structs.append(rep_structs)
-                
-            except pymqi.MQMIError as e:
-                if e.reason == 2033:
-                    done = True
-                else:
-                    raise e
-                
-        pcf_r = PCFCommandResponse(out_structs)
-        return pcf_r
-    
+                    return
+
+        # Opt-in overlapped path (threaded_reader=True, connection made
+        # with MQCNO_HANDLE_SHARE_BLOCK): a reader thread does nothing but
+        # MQGET and hands (message, ccsid) pairs over a small bounded
+        # queue, while this thread unpacks message N during the get of
+        # message N+1.  The reader peeks the CFH Control long straight
+        # out of the raw bytes to know when the last response arrived.
+        long_struct = _LONG_BE if self._need_swap else _LONG_NE
+        msg_queue = queue.Queue(4)
+
+        def _reader():
+            while True:
+                try:
+                    message_data, msg_ccsid = _get_one()
+                    last = long_struct.unpack_from(message_data, 20)[0] == pymqi.CMQCFC.MQCFC_LAST
+                except Exception as e:
+                    # Forward every failure, not just MQMIError - a reader
+                    # that dies without reporting (closed reply queue, a
+                    # reply too short for the Control peek) would leave
+                    # the consumer blocked on msg_queue.get() forever.
+                    msg_queue.put(e)
+                    return
+                msg_queue.put((message_data, msg_ccsid))
+                if last:
+                    return
+
+        reader = threading.Thread(target=_reader)
+        reader.daemon = True
+        reader.start()
+
+        try:
+            while True:
+                item = msg_queue.get()
+                if isinstance(item, Exception):
+                    if isinstance(item, pymqi.MQMIError) and item.reason == 2033:
+                        break
+                    raise item
+
+                message_data, msg_ccsid = item
+                rep_structs = _unpack(message_data, msg_ccsid)
+
+                yield rep_structs
+                if rep_structs[0]["Control"] == pymqi.CMQCFC.MQCFC_LAST:
+                    break
+        finally:
+            # Drain whatever the reader still has buffered so it can run
+            # to the last message even when the consumer abandons the
+            # generator early, then reap the thread.
+            while reader.is_alive():
+                try:
+                    msg_queue.get(True, 0.1)
+                except queue.Empty:
+                    pass
+            reader.join()
+
+    def enable_cache(self, ttl=30, maxsize=1024):
+        """enable_cache(ttl, maxsize)
+
+        Opt in to caching of inquire_q results for ttl seconds, so hot
+        inquiry loops (dashboards, health checks) cost a dict lookup
+        instead of a PCF round-trip.  The cache is LRU-bounded at maxsize
+        entries and entries for a queue are dropped when a create, change,
+        delete, copy or move command for it is issued through this object.
+        Changes made elsewhere only show up once the ttl expires."""
+
+        self._inquire_cache = collections.OrderedDict()
+        self._inquire_cache_ttl = ttl
+        self._inquire_cache_maxsize = maxsize
+
+    def _invalidate_inquire_cache(self, command, parm_list):
+        """_invalidate_inquire_cache(command, parm_list)
+
+        Drop cached inquire_q entries made stale by a queue-mutating
+        command.  Entries whose name pattern covers the affected queue are
+        removed; if the affected name cannot be determined the whole cache
+        is cleared."""
+
+        cache = self._inquire_cache
+        if not cache or command not in _MUTATING_Q_COMMANDS:
+            return
+
+        q_name = None
+        for parm_tpl in parm_list:
+            if type(parm_tpl) is dict:
+                parm, parm_vals = next(iter(parm_tpl.items()))
+            elif type(parm_tpl) is tuple:
+                parm, parm_vals = parm_tpl
+            else:
+                continue
+            if parm == pymqi.CMQC.MQCA_Q_NAME:
+                q_name = parm_vals
+                break
+
+        if q_name is None:
+            cache.clear()
+            return
+
+        if isinstance(q_name, bytes):
+            q_name = q_name.decode("ascii")
+        q_name = q_name.strip()
+        for key in [k for k in cache if fnmatch.fnmatchcase(q_name, k[0].decode("ascii").strip())]:
+            del cache[key]
+
     def inquire_qmgr(self, qmgr_attrs=None, stringify_keys=False):
         """inquire_qmgr(qmgr_attrs, stringify_keys)
         
@@ -1092,34 +1810,71 @@ class PCFCommand(object):
                 return pcf_r.parms[0]
     
     
-    def inquire_q(self, queue_name="*", parms=None, q_attrs=None, stringify_keys=False):
-        """inquire_q(queue_name, parms, q_attrs, stringify_keys)
-        
-        Helper method to inquire the attributes of a Queue.  
+    def inquire_q(self, queue_name="*", parms=None, q_attrs=None, stringify_keys=False, include_status=False):
+        """inquire_q(queue_name, parms, q_attrs, stringify_keys, include_status)
+
+        Helper method to inquire the attributes of a Queue.
         Use parms and q_attrs to specify the attributes to be sent and returned.
-        Use stringify_keys to stringify the PCF attributes that are returned."""
-        
+        Use stringify_keys to stringify the PCF attributes that are returned.
+        Use include_status to also fetch the queue status fields (open
+        counts, last get/put times, ...) merged into each queue's dict."""
+
         if isinstance(queue_name, str):
             queue_name = queue_name.encode("ascii")
-       
+
+        cache = self._inquire_cache
+        if cache is not None:
+            cache_key = (queue_name, repr(parms), repr(q_attrs), stringify_keys, include_status)
+            entry = cache.pop(cache_key, None)
+            if entry is not None and entry[0] >= time.time():
+                # Reinsert to keep the eviction order LRU.
+                cache[cache_key] = entry
+                return entry[1]
+
         parm_list = [{pymqi.CMQC.MQCA_Q_NAME: queue_name}]
-        
+
         if parms is not None:
             for p in parms:
                 parm_list.append(p)
-        
+
         if q_attrs is not None:
             parm_list.append({pymqi.CMQCFC.MQIACF_Q_ATTRS: q_attrs})
-                
-        pcf_r = self.execute_command(pymqi.CMQCFC.MQCMD_INQUIRE_Q, parm_list)
+
+        if include_status:
+            # There is no single PCF command returning definition
+            # attributes and status together, so pipeline the pair as one
+            # batch (one unit of work, replies reaped per command) and
+            # fold the status fields into the attribute dicts by name.
+            pcf_r, status_r = self.execute_commands([
+                (pymqi.CMQCFC.MQCMD_INQUIRE_Q, parm_list),
+                (pymqi.CMQCFC.MQCMD_INQUIRE_Q_STATUS, [{pymqi.CMQC.MQCA_Q_NAME: queue_name}])])
+        else:
+            pcf_r = self.execute_command(pymqi.CMQCFC.MQCMD_INQUIRE_Q, parm_list)
 
         if pcf_r.comp_code == pymqi.CMQC.MQCC_FAILED:
             return None
         else:
+            if include_status and status_r.comp_code != pymqi.CMQC.MQCC_FAILED:
+                by_name = {}
+                for q_dict in pcf_r.parms:
+                    name = q_dict.get(pymqi.CMQC.MQCA_Q_NAME)
+                    if name is not None:
+                        by_name[name.strip()] = q_dict
+                for status_dict in status_r.parms:
+                    name = status_dict.get(pymqi.CMQC.MQCA_Q_NAME)
+                    q_dict = by_name.get(name.strip()) if name is not None else None
+                    if q_dict is not None:
+                        for parm, value in status_dict.items():
+                            q_dict.setdefault(parm, value)
             if stringify_keys:
-                return pcf_r.stringify_keys()
+                ret = pcf_r.stringify_keys()
             else:
-                return pcf_r.parms
+                ret = pcf_r.parms
+            if cache is not None:
+                if len(cache) >= self._inquire_cache_maxsize:
+                    cache.popitem(last=False)
+                cache[cache_key] = (time.time() + self._inquire_cache_ttl, ret)
+            return ret
     
     
     def mqsc_command(self, mqsc_command, one_line=True):
@@ -1145,18 +1900,21 @@ class PCFCommand(object):
             if len(pcf_r.parms) == 0:
                 print("MQSC command Failed! No parms!")
                 return None
-            ret = b""
+            ret_parts = []
             #print pcf_r.stringify_keys()
             for p in pcf_r.parms:
-                
+
                 if pymqi.CMQCFC.MQCACF_ESCAPE_TEXT in p:
+                    text = p[pymqi.CMQCFC.MQCACF_ESCAPE_TEXT]
                     if one_line:
-                        pos = p[pymqi.CMQCFC.MQCACF_ESCAPE_TEXT].find(b"\n")
-                        ret = ret + p[pymqi.CMQCFC.MQCACF_ESCAPE_TEXT][0:pos+1] + p[pymqi.CMQCFC.MQCACF_ESCAPE_TEXT][pos:].strip().replace(b"\n", b" ") + b"\n"
+                        # One pass: keep the first line as-is and collapse
+                        # the rest of the response onto a single line.
+                        head, sep, tail = text.partition(b"\n")
+                        ret_parts.append(head + sep + b" ".join(tail.split()) + b"\n")
                     else:
-                        ret = ret + b"\n" + p[pymqi.CMQCFC.MQCACF_ESCAPE_TEXT]
-            
-            return ret
+                        ret_parts.append(b"\n" + text)
+
+            return b"".join(ret_parts)
 
     def zos_mqsc_command(self, mqsc_command):
         """zos_mqsc_command(mqsc_command)
@@ -1174,21 +1932,14 @@ class PCFCommand(object):
         
         mqmd["Expiry"] = 300
 
-        dynamic_queue_prefix = b"PCF.REPLY.*"
-        dyn_od = pymqi.OD()
-        dyn_od.ObjectName = b"SYSTEM.DEFAULT.MODEL.QUEUE"
-        dyn_od.DynamicQName = dynamic_queue_prefix
-
-        # Open the dynamic queue.
-        dyn_input_open_options = pymqi.CMQC.MQOO_INPUT_SHARED + pymqi.CMQC.MQOO_INQUIRE + pymqi.CMQC.MQOO_FAIL_IF_QUIESCING
-        dyn_queue = pymqi.Queue(self.qmgr, dyn_od, dyn_input_open_options)
-        dyn_queue_name = dyn_od.ObjectName.strip()
+        # Reuse the cached dynamic queue.
+        dyn_queue, dyn_queue_name = self._get_reply_queue()
 
         mqmd["ReplyToQ"] = dyn_queue_name
-    
+
         put_opts = pymqi.pmo(Options = pymqi.CMQC.MQPMO_NO_SYNCPOINT + pymqi.CMQC.MQPMO_FAIL_IF_QUIESCING)
-        if self.convert:
-            msg_body = mqsc_command.encode(self.ccsid_str) 
+        if self._need_convert:
+            msg_body = self._encode_string(mqsc_command)
         else:
             msg_body = mqsc_command
         
@@ -1215,14 +1966,12 @@ class PCFCommand(object):
                 if out_resp is None:
                     out_resp = ""
                 try:
-                    if self.convert:
-                        resp_msg_data = message_data.decode(self.ccsid_str)
+                    if self._need_convert:
+                        resp_msg_data = self._decode_string(message_data)
                     else:
                         resp_msg_data = message_data
                         
-                    remove_ws_re = "([\s]+)"
-                    r = re.compile(remove_ws_re)
-                    resp_msg_data = r.sub(" ", resp_msg_data)
+                    resp_msg_data = _WS_RE.sub(" ", resp_msg_data)
                     out_resp = out_resp + resp_msg_data + "\n"
                     
                     if resp_msg_data.count("CSQN205I") > 0:
@@ -1235,7 +1984,7 @@ class PCFCommand(object):
                     #print "%%%%%%%%%%%%%%%%%%%%", binascii.hexlify(message_data), "%%%%%%%%%%%%%%%%%%%%%%%%%%%%%"
                     raise e
 
-                #rep_structs = self.unpack_bag(message_data, encoding=self.encoding)
+                #rep_structs = self.unpack_bag(message_data, encoding=self._wire_encoding)
                 #if rep_structs[0]["Control"] == pymqi.CMQCFC.MQCFC_LAST:
                 #    done = True
                 #out_structs.append(rep_structs)
@@ -1247,9 +1996,144 @@ class PCFCommand(object):
                     raise e
 
         return out_resp
-    
 
-      
+
+class PCFConnectionPool(object):
+    """PCFConnectionPool(queue_manager, channel, conn_info, user, password, maxsize)
+
+    A small LIFO pool of client connections to one queue manager.  get()
+    hands out an idle pymqi.QueueManager, connecting a fresh one only when
+    the pool is empty, and release() returns a connection for reuse - so
+    scripts (or worker threads) issuing many short admin commands pay
+    MQCONN once per worker instead of once per command.  Pairs with the
+    reply-queue caching inside PCFCommand, which already keeps the
+    SYSTEM.DEFAULT.MODEL.QUEUE open across commands on one connection."""
+
+    def __init__(self, queue_manager, channel, conn_info, user=None, password=None, maxsize=4):
+        self.queue_manager = queue_manager
+        self.channel = channel
+        self.conn_info = conn_info
+        self.user = user
+        self.password = password
+        self.maxsize = maxsize
+        self._idle = []
+        self._lock = threading.Lock()
+
+    def get(self):
+        """get()
+
+        Return an idle connection from the pool, or connect a new one."""
+
+        with self._lock:
+            if self._idle:
+                return self._idle.pop()
+        # Pooled handles cross threads - map_commands hands them to fresh
+        # workers on every call - which is only legal when the connection
+        # is made with MQCNO_HANDLE_SHARE_BLOCK.  The connectTCPClient
+        # default (MQCNO_HANDLE_SHARE_NONE) fails with MQRC_HCONN_ERROR
+        # as soon as another thread reuses the handle.
+        cd = pymqi.cd()
+        cd["ChannelName"] = pymqi.py3str2bytes(self.channel)
+        cd["ConnectionName"] = pymqi.py3str2bytes(self.conn_info)
+        cd["ChannelType"] = pymqi.CMQC.MQCHT_CLNTCONN
+        cd["TransportType"] = pymqi.CMQC.MQXPT_TCP
+        qmgr = pymqi.QueueManager(None)
+        qmgr.connect_with_options(self.queue_manager,
+                                  opts=pymqi.CMQC.MQCNO_HANDLE_SHARE_BLOCK,
+                                  cd=cd, user=self.user, password=self.password)
+        return qmgr
+
+    def release(self, qmgr):
+        """release(qmgr)
+
+        Return a connection to the pool; disconnects it when the pool is
+        already holding maxsize idle connections."""
+
+        with self._lock:
+            if len(self._idle) < self.maxsize:
+                self._idle.append(qmgr)
+                return
+        qmgr.disconnect()
+
+    def close(self):
+        """close()
+
+        Disconnect every idle pooled connection."""
+
+        with self._lock:
+            idle = self._idle
+            self._idle = []
+        for qmgr in idle:
+            qmgr.disconnect()
+
+    def map_commands(self, command_list, workers=4, **pcf_args):
+        """map_commands(command_list, workers, **pcf_args)
+
+        Execute independent PCF commands in parallel, each worker thread
+        on its own pooled connection - MQI allows only one verb in flight
+        per connection, so parallelism comes from extra hconns, and the
+        per-connection ordering guarantee is untouched.  Useful for bulk
+        read-only sweeps (inquiring many queues in a monitoring pass).
+        command_list holds (command, parm_list) pairs; pcf_args are passed
+        to each worker's PCFCommand (ccsid, encoding, convert, zos).
+        Returns one PCFCommandResponse per entry, in input order."""
+
+        results = [None] * len(command_list)
+        if not command_list:
+            return results
+
+        # Pool connections are made with MQCNO_HANDLE_SHARE_BLOCK, so the
+        # overlapped reply reader is legal here; callers can still pass
+        # threaded_reader=False to force inline gets.
+        pcf_args.setdefault("threaded_reader", True)
+
+        task_queue = queue.Queue()
+        for task in enumerate(command_list):
+            task_queue.put(task)
+        errors = []
+
+        def _worker():
+            qmgr = None
+            pcf = None
+            try:
+                # Acquire inside the try: a failing connect (host down,
+                # not authorized) must land in errors, not kill the
+                # worker silently.
+                try:
+                    qmgr = self.get()
+                    pcf = PCFCommand(qmgr, **pcf_args)
+                except Exception as e:
+                    errors.append(e)
+                    return
+                while not errors:
+                    try:
+                        index, (command, parm_list) = task_queue.get_nowait()
+                    except queue.Empty:
+                        return
+                    try:
+                        results[index] = pcf.execute_command(command, parm_list)
+                    except Exception as e:
+                        errors.append(e)
+                        return
+            finally:
+                if pcf is not None:
+                    pcf.close()
+                if qmgr is not None:
+                    self.release(qmgr)
+
+        threads = [threading.Thread(target=_worker)
+                   for _ in range(min(workers, len(command_list)))]
+        for t in threads:
+            t.daemon = True
+            t.start()
+        for t in threads:
+            t.join()
+
+        if errors:
+            raise errors[0]
+        return results
+
+
 if __name__ == '__main__':
     
     epilog = """
@@ -1275,6 +2159,13 @@ if __name__ == '__main__':
 
     args = parser.parse_args()
 
+    # Test output goes through logging with lazy % formatting: the full
+    # response reprs are debug-level and only get built under -v, the
+    # comp/reason code summaries (plain ints) always print.
+    logging.basicConfig(format="%(message)s",
+                        level=logging.DEBUG if args.verbose else logging.INFO)
+    log = logging.getLogger("pymqi.pcf")
+
     if args.host is None:
         print("Host required.")
         parser.print_help()
@@ -1346,92 +2237,91 @@ if __name__ == '__main__':
             print(result)
         else:
            
-            print("\n--------------- Inquire queue manager all --------------------")
+            log.info("\n--------------- Inquire queue manager all --------------------")
             pcf_r = pcf_c.execute_command(pymqi.CMQCFC.MQCMD_INQUIRE_Q_MGR,[(pymqi.CMQCFC.MQIACF_Q_MGR_ATTRS, [pymqi.CMQC.MQCA_ALTERATION_DATE])])
-            print("Comp code:", pcf_r.comp_code, " Reason code:", pcf_r.reason_code)
-            print(pcf_r.stringify_keys())
+            log.info("Comp code: %s  Reason code: %s", pcf_r.comp_code, pcf_r.reason_code)
+            log.debug("%s", pcf_r.stringify_keys())
             
-            print("\n--------------- QM attrs all with exec:----------------")
+            log.info("\n--------------- QM attrs all with exec:----------------")
             pcf_r = pcf_c.execute_command(pymqi.CMQCFC.MQCMD_INQUIRE_Q_MGR)
-            print(pcf_r)
+            log.debug("%s", pcf_r)
             
-            print("\n--------------- QM attrs all with inquire_qm:--------------------------")
+            log.info("\n--------------- QM attrs all with inquire_qm:--------------------------")
             qm_resp = pcf_c.inquire_qmgr(stringify_keys=False)
-            print("Alteration date is:" + str(qm_resp[pymqi.CMQC.MQCA_ALTERATION_DATE])) 
+            log.info("Alteration date is: %s", qm_resp[pymqi.CMQC.MQCA_ALTERATION_DATE])
             
-            print("\n--------------- QM Only MQCA_ALTERATION_DATE with exec:-------------------")
+            log.info("\n--------------- QM Only MQCA_ALTERATION_DATE with exec:-------------------")
             pcf_r = pcf_c.execute_command(pymqi.CMQCFC.MQCMD_INQUIRE_Q_MGR, [(pymqi.CMQCFC.MQIACF_Q_MGR_ATTRS, [pymqi.CMQC.MQCA_ALTERATION_DATE])])
-            print(pcf_r)
-            print("Comp code:", pcf_r.comp_code, " Reason code:", pcf_r.reason_code)
-            print("Alteration date is:" + str(pcf_r.parms[0][pymqi.CMQC.MQCA_ALTERATION_DATE]))
+            log.debug("%s", pcf_r)
+            log.info("Comp code: %s  Reason code: %s", pcf_r.comp_code, pcf_r.reason_code)
+            log.info("Alteration date is: %s", pcf_r.parms[0][pymqi.CMQC.MQCA_ALTERATION_DATE])
             #print("Alteration date is getattr:" + str(pcf_r[pymqi.CMQC.MQCA_ALTERATION_DATE]))
             
-            print("\n--------------- QM Only MQCA_ALTERATION_DATE - stringified:--------------")
-            print(pcf_c.inquire_qmgr(qmgr_attrs=[pymqi.CMQC.MQCA_ALTERATION_DATE], stringify_keys=True))
-            print("\n--------------- QM MQCA_ALTERATION_DATE - not stringified:----------")
-            print(pcf_c.inquire_qmgr(qmgr_attrs=[pymqi.CMQC.MQCA_ALTERATION_DATE], stringify_keys=False))
+            log.info("\n--------------- QM Only MQCA_ALTERATION_DATE - stringified:--------------")
+            log.debug("%s", pcf_c.inquire_qmgr(qmgr_attrs=[pymqi.CMQC.MQCA_ALTERATION_DATE], stringify_keys=True))
+            log.info("\n--------------- QM MQCA_ALTERATION_DATE - not stringified:----------")
+            log.debug("%s", pcf_c.inquire_qmgr(qmgr_attrs=[pymqi.CMQC.MQCA_ALTERATION_DATE], stringify_keys=False))
 
 
-            print("\n--------------- Inquire_q. by Q type ------------------")
+            log.info("\n--------------- Inquire_q. by Q type ------------------")
             q_resp = pcf_c.inquire_q("SYSTEM.DEFAULT.*", parms=[{pymqi.CMQC.MQIA_Q_TYPE: pymqi.CMQC.MQQT_LOCAL}], stringify_keys=False)
-            print(q_resp)
-            print("\n-------------------------")
+            log.debug("%s", q_resp)
+            log.info("\n-------------------------")
             for q in q_resp:
-                print("Q Name:", q[pymqi.CMQC.MQCA_Q_NAME], "Q depth:", q[pymqi.CMQC.MQIA_CURRENT_Q_DEPTH])
+                log.info("Q Name: %s Q depth: %s", q[pymqi.CMQC.MQCA_Q_NAME], q[pymqi.CMQC.MQIA_CURRENT_Q_DEPTH])
 
 
-            print("\n--------------- Inquire_q. by Q type - not stringified--------------")
-            print(pcf_c.inquire_q("SYSTEM.DEFAULT.*", parms=[{pymqi.CMQC.MQIA_Q_TYPE: pymqi.CMQC.MQQT_LOCAL}], stringify_keys=False))
+            log.info("\n--------------- Inquire_q. by Q type - not stringified--------------")
+            log.debug("%s", pcf_c.inquire_q("SYSTEM.DEFAULT.*", parms=[{pymqi.CMQC.MQIA_Q_TYPE: pymqi.CMQC.MQQT_LOCAL}], stringify_keys=False))
 
-            print("\n--------------- Inquire_q.  Q type with attrs-----------------------")
-            print(pcf_c.inquire_q("SYSTEM.DEFAULT.*", parms=[{pymqi.CMQC.MQIA_Q_TYPE: pymqi.CMQC.MQQT_LOCAL}], q_attrs=[pymqi.CMQC.MQCA_Q_NAME, pymqi.CMQC.MQIA_CURRENT_Q_DEPTH], stringify_keys=True))
+            log.info("\n--------------- Inquire_q.  Q type with attrs-----------------------")
+            log.debug("%s", pcf_c.inquire_q("SYSTEM.DEFAULT.*", parms=[{pymqi.CMQC.MQIA_Q_TYPE: pymqi.CMQC.MQQT_LOCAL}], q_attrs=[pymqi.CMQC.MQCA_Q_NAME, pymqi.CMQC.MQIA_CURRENT_Q_DEPTH], stringify_keys=True))
 
-            print("\n--------------- Inquire_q.  Q type - tuple parms with attrs-----------------------------------------------")
-            print(pcf_c.inquire_q("SYSTEM.DEFAULT.*", parms=[(pymqi.CMQC.MQIA_Q_TYPE, pymqi.CMQC.MQQT_LOCAL)], q_attrs=[pymqi.CMQC.MQCA_Q_NAME, pymqi.CMQC.MQIA_CURRENT_Q_DEPTH], stringify_keys=False))
+            log.info("\n--------------- Inquire_q.  Q type - tuple parms with attrs-----------------------------------------------")
+            log.debug("%s", pcf_c.inquire_q("SYSTEM.DEFAULT.*", parms=[(pymqi.CMQC.MQIA_Q_TYPE, pymqi.CMQC.MQQT_LOCAL)], q_attrs=[pymqi.CMQC.MQCA_Q_NAME, pymqi.CMQC.MQIA_CURRENT_Q_DEPTH], stringify_keys=False))
             
   
-            print("\n--------------- DIS QL(SYSTEM.DEFAULT.*) using mqsc_command...-----------")
-            print(pcf_c.mqsc_command("DIS QL(SYSTEM.DEFAULT.*) ALL"))
+            log.info("\n--------------- DIS QL(SYSTEM.DEFAULT.*) using mqsc_command...-----------")
+            log.debug("%s", pcf_c.mqsc_command("DIS QL(SYSTEM.DEFAULT.*) ALL"))
             #print pcf_c.mqsc_command("DIS Q(SYSTEM.*) ")
             
-            print("\n--------------- DIS QL(SYSTEM.DEFAULT.*) using ESCAPE...-----------------")
+            log.info("\n--------------- DIS QL(SYSTEM.DEFAULT.*) using ESCAPE...-----------------")
             if args.zos:
-                print(pcf_c.execute_command(pymqi.CMQCFC.MQCMD_ESCAPE, [(pymqi.CMQCFC.MQIACF_ESCAPE_TYPE, pymqi.CMQCFC.MQET_MQSC), (pymqi.CMQCFC.MQCACF_ESCAPE_TEXT, "DIS QL(SYSTEM.DEFAULT.*)".encode("cp037"))]))
+                log.debug("%s", pcf_c.execute_command(pymqi.CMQCFC.MQCMD_ESCAPE, [(pymqi.CMQCFC.MQIACF_ESCAPE_TYPE, pymqi.CMQCFC.MQET_MQSC), (pymqi.CMQCFC.MQCACF_ESCAPE_TEXT, _CP037_ENCODE("DIS QL(SYSTEM.DEFAULT.*)")[0])]))
             else:
-                print(pcf_c.execute_command(pymqi.CMQCFC.MQCMD_ESCAPE, [(pymqi.CMQCFC.MQIACF_ESCAPE_TYPE, pymqi.CMQCFC.MQET_MQSC), (pymqi.CMQCFC.MQCACF_ESCAPE_TEXT, b"DIS QL(SYSTEM.DEFAULT.*)")]))
+                log.debug("%s", pcf_c.execute_command(pymqi.CMQCFC.MQCMD_ESCAPE, [(pymqi.CMQCFC.MQIACF_ESCAPE_TYPE, pymqi.CMQCFC.MQET_MQSC), (pymqi.CMQCFC.MQCACF_ESCAPE_TEXT, b"DIS QL(SYSTEM.DEFAULT.*)")]))
 
      
-            print("\n--------------- Inquire_q. with exec:-------------------")
+            log.info("\n--------------- Inquire_q. with exec:-------------------")
             pcf_r = pcf_c.execute_command(pymqi.CMQCFC.MQCMD_INQUIRE_Q, [(pymqi.CMQC.MQCA_Q_NAME, b"SYSTEM.DEFAULT.*"), (pymqi.CMQC.MQIA_Q_TYPE, pymqi.CMQC.MQQT_LOCAL), (pymqi.CMQCFC.MQIACF_Q_ATTRS, [pymqi.CMQC.MQCA_Q_NAME,pymqi.CMQC.MQIA_Q_TYPE,pymqi.CMQC.MQIA_MAX_Q_DEPTH])])
-            print(pcf_r)
-            print("Comp code:", pcf_r.comp_code, " Reason code:", pcf_r.reason_code)
-            for q in pcf_r.parms:
-                print(q)
+            log.debug("%s", pcf_r)
+            log.info("Comp code: %s  Reason code: %s", pcf_r.comp_code, pcf_r.reason_code)
+            # One buffered write instead of a write() per parameter - a
+            # wildcard INQUIRE can return hundreds of entries - and only
+            # when verbose: the join is skipped entirely when quiet.
+            if log.isEnabledFor(logging.DEBUG):
+                sys.stdout.write("\n".join(str(q) for q in pcf_r.parms) + "\n")
 
 
 
-            print("\n--------------- create PYMQI.PCF.TEST.QUEUE queue -----------------")
+            log.info("\n--------------- create / inquire / delete PYMQI.PCF.TEST.QUEUE as one batch -----------------")
             create_q_parms= [(pymqi.CMQC.MQCA_Q_NAME, b"PYMQI.PCF.TEST.QUEUE"), (pymqi.CMQC.MQIA_Q_TYPE, pymqi.CMQC.MQQT_LOCAL), (pymqi.CMQC.MQIA_MAX_Q_DEPTH, 10), ]
-            pcf_r = pcf_c.execute_command(pymqi.CMQCFC.MQCMD_CREATE_Q, create_q_parms)
-            print("Comp code:", pcf_r.comp_code, " Reason code:", pcf_r.reason_code)
-            print(pcf_r)
-            
-            print("\n--------------- Inquire_q PYMQI.PCF.TEST.QUEUE.  Q type - tuple parms with attrs-----------------------------------------------")
-            print(pcf_c.inquire_q("PYMQI.PCF.TEST.QUEUE", parms=[(pymqi.CMQC.MQIA_Q_TYPE, pymqi.CMQC.MQQT_LOCAL)], q_attrs=[pymqi.CMQC.MQCA_Q_NAME, pymqi.CMQC.MQIA_CURRENT_Q_DEPTH], stringify_keys=False))
-            
-            print("\n--------------- Delete PYMQI.PCF.TEST.QUEUE qeueue -----------------")
+            inquire_q_parms = [(pymqi.CMQC.MQCA_Q_NAME, b"PYMQI.PCF.TEST.QUEUE"), (pymqi.CMQC.MQIA_Q_TYPE, pymqi.CMQC.MQQT_LOCAL), (pymqi.CMQCFC.MQIACF_Q_ATTRS, [pymqi.CMQC.MQCA_Q_NAME, pymqi.CMQC.MQIA_CURRENT_Q_DEPTH])]
             del_q_parms= [(pymqi.CMQC.MQCA_Q_NAME, b"PYMQI.PCF.TEST.QUEUE"), (pymqi.CMQC.MQIA_Q_TYPE, pymqi.CMQC.MQQT_LOCAL)]
-            pcf_r = pcf_c.execute_command(pymqi.CMQCFC.MQCMD_DELETE_Q, del_q_parms)
-            print("Comp code:", pcf_r.comp_code, " Reason code:", pcf_r.reason_code)
-            print(pcf_r)
+            for pcf_r in pcf_c.execute_commands([
+                    (pymqi.CMQCFC.MQCMD_CREATE_Q, create_q_parms),
+                    (pymqi.CMQCFC.MQCMD_INQUIRE_Q, inquire_q_parms),
+                    (pymqi.CMQCFC.MQCMD_DELETE_Q, del_q_parms)]):
+                log.info("Comp code: %s  Reason code: %s", pcf_r.comp_code, pcf_r.reason_code)
+                log.debug("%s", pcf_r)
 
             if args.zos:
-                print("MQSC - MQCMD_ESCAPE - using execute command.  show zos not supported.-----------------------------------------  ")
-                print(pcf_c.execute_command(pymqi.CMQCFC.MQCMD_ESCAPE, [(pymqi.CMQCFC.MQIACF_ESCAPE_TYPE, pymqi.CMQCFC.MQET_MQSC), (pymqi.CMQCFC.MQCACF_ESCAPE_TEXT, "DIS QL(*)".encode("cp037"))]))
+                log.info("MQSC - MQCMD_ESCAPE - using execute command.  show zos not supported.-----------------------------------------  ")
+                log.debug("%s", pcf_c.execute_command(pymqi.CMQCFC.MQCMD_ESCAPE, [(pymqi.CMQCFC.MQIACF_ESCAPE_TYPE, pymqi.CMQCFC.MQET_MQSC), (pymqi.CMQCFC.MQCACF_ESCAPE_TEXT, _CP037_ENCODE("DIS QL(*)")[0])]))
                 # print "CMD MQCMD_ESCAPE with convert."
                 # print pcf_c.execute_command_d(pymqi.CMQCFC.MQCMD_ESCAPE, [{pymqi.CMQCFC.MQIACF_ESCAPE_TYPE: pymqi.CMQCFC.MQET_MQSC}, {pymqi.CMQCFC.MQCACF_ESCAPE_TEXT: "DIS QL(*)".encode("cp037")}], convert=True)
 
 
     except Exception as ex:
-        print(str(ex))
+        log.error("%s", ex)
     